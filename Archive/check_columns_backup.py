@@ -1,15 +1,23 @@
 import pandas as pd
+import openpyxl
 
 # This script helps you see what columns are in your Excel file
 excel_file = r"C:\Users\MarkAnderson\Valorem\Knowledge Hub - Documents\Pricing\Customer Price Lists\Price Sheet Sending_Python\Python_CustomerPricing.xlsx"
 
 print("Reading Excel file to check column names...")
-df = pd.read_excel(excel_file)
+# Only the header and a handful of rows are needed here; nrows keeps
+# pandas from materializing the whole sheet
+df = pd.read_excel(excel_file, nrows=5)
 
 print("\nYour Excel file has the following columns:")
 for i, column in enumerate(df.columns, 1):
     print(f"{i}. '{column}'")
 
-print(f"\nTotal number of rows: {len(df)}")
+# Row count comes from the sheet dimensions instead of a full parse
+wb = openpyxl.load_workbook(excel_file, read_only=True)
+total_rows = wb.active.max_row - 1  # minus the header row
+wb.close()
+
+print(f"\nTotal number of rows: {total_rows}")
 print("\nFirst few rows of data:")
-print(df.head())
\ No newline at end of file
+print(df)
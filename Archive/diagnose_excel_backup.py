@@ -1,4 +1,3 @@
-import pandas as pd
 import openpyxl
 
 # This diagnostic script will show us exactly what's in your Excel file
@@ -6,72 +5,78 @@ excel_file = r"C:\Users\MarkAnderson\Valorem\Knowledge Hub - Documents\Pricing\C
 
 print("=== DETAILED EXCEL FILE ANALYSIS ===\n")
 
+# One streaming pass over the workbook serves every section below.
+# read_only=True skips building the in-memory object graph, and reusing
+# the rows avoids re-parsing the file for each diagnostic view.
+wb = openpyxl.load_workbook(excel_file, read_only=True, data_only=True)
+sheet = wb.active
+
+preview_rows = []   # first 10 rows, reused by sections 1-3
+header_hits = []    # (row index, values) for rows containing column names
+
+for idx, row in enumerate(sheet.iter_rows(values_only=True)):
+    if idx < 10:
+        preview_rows.append(list(row))
+    row_str = ' '.join(str(val) for val in row if val is not None)
+    if 'CustomerName' in row_str or 'RecipientName' in row_str:
+        header_hits.append((idx, list(row)))
+
+sheet_title = sheet.title
+max_row = sheet.max_row
+max_column = sheet.max_column
+wb.close()
+
 # Method 1: Let's see the first 10 rows without any processing
 print("1. RAW VIEW - First 10 rows of the Excel file:")
 print("-" * 80)
-df_raw = pd.read_excel(excel_file, header=None, nrows=10)
-for idx, row in df_raw.iterrows():
-    print(f"Row {idx}: {row.tolist()}")
+for idx, row in enumerate(preview_rows):
+    print(f"Row {idx}: {row}")
 
 print("\n" + "="*80 + "\n")
 
-# Method 2: Let's try different header positions
+# Method 2: Let's try different header positions (sliced from the rows
+# we already read rather than re-reading the file)
 print("2. TRYING DIFFERENT HEADER POSITIONS:")
 print("-" * 80)
 
-for header_row in range(5):  # Try first 5 rows as potential headers
-    try:
-        df_test = pd.read_excel(excel_file, header=header_row, nrows=3)
-        print(f"\nIf we use row {header_row} as header:")
-        print(f"Columns found: {df_test.columns.tolist()}")
-        if len(df_test) > 0:
-            print(f"First data row: {df_test.iloc[0].tolist()}")
-    except Exception as e:
-        print(f"Error with header={header_row}: {e}")
+for header_row in range(min(5, len(preview_rows))):
+    print(f"\nIf we use row {header_row} as header:")
+    print(f"Columns found: {preview_rows[header_row]}")
+    if header_row + 1 < len(preview_rows):
+        print(f"First data row: {preview_rows[header_row + 1]}")
 
 print("\n" + "="*80 + "\n")
 
-# Method 3: Let's look at the actual Excel structure using openpyxl
+# Method 3: Sheet structure summary
 print("3. DIRECT EXCEL INSPECTION (using openpyxl):")
 print("-" * 80)
 
-wb = openpyxl.load_workbook(excel_file, read_only=True)
-sheet = wb.active
-
-print(f"Sheet name: {sheet.title}")
-print(f"Max row: {sheet.max_row}")
-print(f"Max column: {sheet.max_column}")
+print(f"Sheet name: {sheet_title}")
+print(f"Max row: {max_row}")
+print(f"Max column: {max_column}")
 print("\nFirst 10 rows (showing first 5 columns only for readability):")
 
-for row_num in range(1, min(11, sheet.max_row + 1)):
+for row_num, row in enumerate(preview_rows, 1):
     row_data = []
-    for col_num in range(1, min(6, sheet.max_column + 1)):
-        cell_value = sheet.cell(row=row_num, column=col_num).value
+    for cell_value in row[:5]:
         if cell_value is None:
             row_data.append("EMPTY")
         else:
             row_data.append(str(cell_value)[:30])  # Truncate long values
     print(f"Row {row_num}: {row_data}")
 
-wb.close()
-
 print("\n" + "="*80 + "\n")
 
-# Method 4: Let's find where the actual data starts
+# Method 4: Let's find where the actual data starts (hits were collected
+# during the single pass above)
 print("4. SEARCHING FOR YOUR COLUMN NAMES:")
 print("-" * 80)
 
-# Read without headers to search for our expected column names
-df_search = pd.read_excel(excel_file, header=None)
+for idx, row in header_hits:
+    print(f"\nFound column names in row {idx}!")
+    print(f"Values in this row: {[val for val in row if val is not None][:8]}")  # Show first 8 non-empty values
 
-# Look for rows containing our expected column names
-for idx, row in df_search.iterrows():
-    row_str = ' '.join([str(val) for val in row if pd.notna(val)])
-    if 'CustomerName' in row_str or 'RecipientName' in row_str:
-        print(f"\nFound column names in row {idx}!")
-        print(f"Values in this row: {[val for val in row if pd.notna(val)][:8]}")  # Show first 8 non-empty values
-        
-        # Let's also check what's in the next row
-        if idx + 1 < len(df_search):
-            next_row = df_search.iloc[idx + 1]
-            print(f"Next row contains: {[val for val in next_row if pd.notna(val)][:5]}")  # Show first 5 values
\ No newline at end of file
+    # Let's also check what's in the next row
+    if idx + 1 < len(preview_rows):
+        next_row = preview_rows[idx + 1]
+        print(f"Next row contains: {[val for val in next_row if val is not None][:5]}")  # Show first 5 values
@@ -1,8 +1,42 @@
 import win32com.client
 import pandas as pd
 import os
+import string
 from datetime import datetime
 
+# The HTML body is identical apart from the greeting, so compile the
+# template once instead of rebuilding the whole string for every draft
+_BODY_TEMPLATE = string.Template("""
+            <html>
+                <body style="font-family: Arial, sans-serif;">
+                    <p>Hi ${recipient},</p>
+
+                    <p>Just a quick note to share the updated pricing for your account - attached for reference.</p>
+
+                    <p>No change in pricing for September, as FX movement stayed within the 2% band.</p>
+
+                    <p>Thanks,</p>
+
+                    <p>
+                        <strong>Mark Anderson</strong><br>
+                        Managing Director<br>
+                        <strong style="color: rgb(74, 144, 226);">Valorem Chemicals Pty Ltd</strong><br>
+                        Phone: +61 417 725 006<br>
+                        Email: marka@valorem.com.au<br>
+                        Web: www.valorem.com.au
+                    </p>
+
+                    <p style="font-size: 10px;">
+                        This email and any files transmitted with it are confidential and
+                        intended solely for the use of the individual or entity to whom they are addressed.
+                    </p>
+                </body>
+            </html>
+            """)
+
+# Same CC line on every draft
+_CC_ADDRESSES = "support@valorem.com.au;jasonn@valorem.com.au"
+
 def create_email_drafts():
     """
     Creates draft emails in Outlook with proper HTML formatting and attachments.
@@ -43,75 +77,56 @@ def create_email_drafts():
     
     # Step 3: Create a draft for each customer
     drafts_created = 0
-    
-    for index, row in df.iterrows():
+
+    # Each attachment folder is listed once; repeated os.path.exists
+    # calls against synced SharePoint folders are slow
+    folder_contents = {}
+
+    # itertuples avoids building a pandas Series for every row
+    for row in df.itertuples(index=False):
+        customer = getattr(row, 'CustomerName', '')
         try:
             # Create a new email draft
             mail = outlook.CreateItem(0)  # 0 = Mail item
-            
+
             # Set the recipients
-            mail.To = row['EmailAddresses']
-            
+            mail.To = row.EmailAddresses
+
             # Set CC and BCC if needed
-            mail.CC = "support@valorem.com.au;jasonn@valorem.com.au"
-            
+            mail.CC = _CC_ADDRESSES
+
             # Set the subject
-            mail.Subject = f"Monthly Pricing Update for {row['CustomerName']}"
-            
-            # Create the HTML body with proper formatting
-            mail.HTMLBody = f"""
-            <html>
-                <body style="font-family: Arial, sans-serif;">
-                    <p>Hi {row['RecipientName']},</p>
-                    
-                    <p>Just a quick note to share the updated pricing for your account - attached for reference.</p>
-                    
-                    <p>No change in pricing for September, as FX movement stayed within the 2% band.</p>
-                    
-                    <p>Thanks,</p>
-                    
-                    <p>
-                        <strong>Mark Anderson</strong><br>
-                        Managing Director<br>
-                        <strong style="color: rgb(74, 144, 226);">Valorem Chemicals Pty Ltd</strong><br>
-                        Phone: +61 417 725 006<br>
-                        Email: marka@valorem.com.au<br>
-                        Web: www.valorem.com.au
-                    </p>
-                    
-                    <p style="font-size: 10px;">
-                        This email and any files transmitted with it are confidential and 
-                        intended solely for the use of the individual or entity to whom they are addressed.
-                    </p>
-                </body>
-            </html>
-            """
-            
+            mail.Subject = f"Monthly Pricing Update for {customer}"
+
+            # Fill the precompiled HTML body template
+            mail.HTMLBody = _BODY_TEMPLATE.substitute(recipient=row.RecipientName)
+
             # Attach the local file (FilePath = folder, FileName = filename)
-            folder   = row.get('FilePath', '').strip()
-            filename = row.get('FileName', '').strip()
+            folder   = str(getattr(row, 'FilePath', '') or '').strip()
+            filename = str(getattr(row, 'FileName', '') or '').strip()
+            file_found = False
             if folder and filename:
-                fullpath = os.path.join(folder, filename)
-                if os.path.exists(fullpath):
-                    mail.Attachments.Add(fullpath)
+                if folder not in folder_contents:
+                    folder_contents[folder] = set(os.listdir(folder)) if os.path.isdir(folder) else set()
+                file_found = filename in folder_contents[folder]
+                if file_found:
+                    mail.Attachments.Add(os.path.join(folder, filename))
                 else:
-                    print(f"⚠ File not found for {row['CustomerName']}: {fullpath}")
-            
+                    print(f"⚠ File not found for {customer}: {os.path.join(folder, filename)}")
+
             # Save as draft (not send)
             mail.Save()
-            
+
             # Show what file was attached (or attempted to be attached)
             attached_file = "No file specified"
             if folder and filename:
-                attached_file = filename
-                if not os.path.exists(os.path.join(folder, filename)):
-                    attached_file = f"{filename} (FILE NOT FOUND!)"
+                attached_file = filename if file_found else f"{filename} (FILE NOT FOUND!)"
 
-            print(f"✓ Created draft for {row['CustomerName']} ({row['EmailAddresses']}) - Attached: {attached_file}")
+            print(f"✓ Created draft for {customer} ({row.EmailAddresses}) - Attached: {attached_file}")
             drafts_created += 1
-            
+
         except Exception as e:
-            print(f"✗ Error creating draft for {row['CustomerName']}: {str(e)}")
+            print(f"✗ Error creating draft for {customer}: {str(e)}")
     
     print(f"\nCompleted! Created {drafts_created} draft emails.")
     print("Check your Outlook Drafts folder to review before sending.")
@@ -5,16 +5,73 @@ Redesigned with two-column layout, bug fixes, and debugging features
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+import calendar
 import os
 import json
+import re
 import sys
+from collections import deque, namedtuple
 from datetime import date, datetime
-from dateutil.relativedelta import relativedelta
-import pandas as pd
-import threading
-from src import email_generator
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Placeholder tokens like {recipient_name}; compiled once at import
+_PLACEHOLDER_RE = re.compile(r'\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+# Signature lines in rough order of how often they appear first in a
+# pasted signature block
+SIGNATURE_MARKERS = (
+    "Mark Anderson",
+    "Managing Director",
+    "Valorem Chemicals",
+    "+61 417 725 006",
+    "marka@valorem.com.au",
+)
+
+_MonthStrings = namedtuple(
+    '_MonthStrings',
+    ['current_date', 'month_name', 'previous_month_name', 'next_month_effective'])
+
+
+@lru_cache(maxsize=64)
+def _resolve_month_strings(month, year):
+    """Month/date strings for one (month, year) selection.
+
+    Cached so repeated preview/generate presses for the same month skip
+    the datetime/relativedelta/strftime work on the UI thread.
+    """
+    from dateutil.relativedelta import relativedelta
+
+    current_date = datetime(year, month, 1)
+    previous = current_date - relativedelta(months=1)
+    following = current_date + relativedelta(months=1)
+    effective = f"{calendar.month_name[following.month]} 1, {following.year}"
+    return _MonthStrings(
+        current_date,
+        calendar.month_name[month],
+        calendar.month_name[previous.month],
+        effective)
 
 class PriceSheetDashboard:
+    # Signature appended to previews; constant across clicks
+    PREVIEW_SIGNATURE = (
+        "\n\nMark Anderson"
+        "\nManaging Director"
+        "\nValorem Chemicals Pty Ltd"
+        "\n+61 417 725 006"
+        "\nmarka@valorem.com.au"
+        "\nwww.valorem.com.au"
+    )
+
+    # Cap for both the message history and the debug Text widget so
+    # long generation runs don't grow either without bound
+    MAX_DEBUG_LINES = 2000
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("VALOREM CHEMICALS - Monthly Email Draft Dashboard")
@@ -40,7 +97,42 @@ class PriceSheetDashboard:
 
         # Debug mode flag
         self.debug_mode = tk.BooleanVar(value=False)
-        self.debug_messages = []
+        self.debug_messages = deque(maxlen=self.MAX_DEBUG_LINES)
+        # Debug lines waiting to be inserted; bursts are coalesced into a
+        # single Text insert by _flush_debug instead of one per line
+        self._debug_pending = []
+        self._debug_flush_scheduled = False
+
+        # Latest (value, message) from the generation callback; applied
+        # by _flush_progress at most once per 50ms. The after id is kept
+        # so a pending flush can be cancelled once results come in
+        self._pending_progress = None
+        self._progress_flush_id = None
+
+        # Signature detection: one compiled alternation over the markers,
+        # plus a small memo so the save -> preview -> generate sequence
+        # strips the same draft once instead of rescanning it each time
+        self._sig_re = re.compile(
+            '|'.join(re.escape(marker) for marker in SIGNATURE_MARKERS))
+        self._strip_cache = {}
+
+        # Draft content pre-split into literal/placeholder segments,
+        # keyed on the content hash; repeat previews of an unchanged
+        # draft skip the regex scan and just re-join with fresh values
+        self._preview_cache = {}
+
+        # Parsed email_templates.json keyed on file mtime, and monthly
+        # draft contents keyed on (path, mtime, size); both reload only
+        # when the file actually changes on disk
+        self._templates_cache = None
+        self._draft_file_cache = {}
+
+        # Single-worker pools: one for draft writes so a slow or synced
+        # drive never blocks the Tk event loop, one reused across
+        # generation runs instead of spawning a thread per click
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._gen_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gen')
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Create monthly_drafts directory if it doesn't exist
         self.drafts_dir = os.path.join(os.path.dirname(__file__), 'monthly_drafts')
@@ -50,6 +142,16 @@ class PriceSheetDashboard:
 
     def setup_ui(self):
         """Setup the user interface with two-column layout"""
+        # Shared ttk styles; buttons draw from these named styles instead
+        # of each carrying its own bg/fg/font/relief kwargs
+        self.style = ttk.Style()
+        self.style.configure('Secondary.TButton', font=('Arial', 10, 'bold'),
+                             background=self.colors['secondary'], foreground='white')
+        self.style.configure('Primary.TButton', font=('Arial', 11, 'bold'),
+                             background=self.colors['primary'], foreground='white')
+        self.style.configure('Generate.TButton', font=('Arial', 12, 'bold'),
+                             background=self.colors['primary'], foreground='white')
+
         # Header
         self.create_header()
 
@@ -135,6 +237,22 @@ class PriceSheetDashboard:
         )
         self.draft_text.pack(fill=tk.BOTH, expand=True)
 
+        # Cache the stripped widget contents; <<Modified>> invalidates it
+        # so preview/save/generate don't each re-fetch the whole buffer
+        self._clean_content = None
+        self.draft_text.bind('<<Modified>>', self._on_draft_modified)
+
+    def _on_draft_modified(self, event=None):
+        """Invalidate the cached draft content when the widget changes"""
+        self._clean_content = None
+        self.draft_text.edit_modified(False)
+
+    def _get_clean_content(self):
+        """Return the draft text with surrounding whitespace stripped"""
+        if self._clean_content is None:
+            self._clean_content = self.draft_text.get(1.0, tk.END).strip()
+        return self._clean_content
+
     def create_preview_section(self, parent):
         """Create the preview section in left column"""
         preview_frame = tk.LabelFrame(
@@ -160,6 +278,20 @@ class PriceSheetDashboard:
         )
         self.preview_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
+    def _make_section(self, parent, title):
+        """Create a titled LabelFrame and return its padded inner frame"""
+        section = tk.LabelFrame(
+            parent,
+            text=title,
+            font=('Arial', 10, 'bold'),
+            bg=self.colors['bg_white']
+        )
+        section.pack(fill=tk.X, pady=(0, 15))
+
+        inner = tk.Frame(section, bg=self.colors['bg_white'])
+        inner.pack(padx=10, pady=10)
+        return inner
+
     def create_controls_section(self, parent):
         """Create all controls in right column"""
         # Controls Frame
@@ -179,16 +311,7 @@ class PriceSheetDashboard:
         inner_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
 
         # Date Selection Section
-        date_section = tk.LabelFrame(
-            inner_frame,
-            text="Date Selection",
-            font=('Arial', 10, 'bold'),
-            bg=self.colors['bg_white']
-        )
-        date_section.pack(fill=tk.X, pady=(0, 15))
-
-        date_inner = tk.Frame(date_section, bg=self.colors['bg_white'])
-        date_inner.pack(padx=10, pady=10)
+        date_inner = self._make_section(inner_frame, "Date Selection")
 
         # Month selector
         month_frame = tk.Frame(date_inner, bg=self.colors['bg_white'])
@@ -226,116 +349,32 @@ class PriceSheetDashboard:
         year_combo.pack(side=tk.LEFT, padx=(5, 0))
         year_combo.bind('<<ComboboxSelected>>', self.on_date_changed)
 
-        # Draft Operations Section
-        draft_section = tk.LabelFrame(
-            inner_frame,
-            text="Draft Operations",
-            font=('Arial', 10, 'bold'),
-            bg=self.colors['bg_white']
-        )
-        draft_section.pack(fill=tk.X, pady=(0, 15))
-
-        draft_inner = tk.Frame(draft_section, bg=self.colors['bg_white'])
-        draft_inner.pack(padx=10, pady=10)
-
-        # Load draft button
-        load_btn = tk.Button(
-            draft_inner,
-            text="Load Draft",
-            command=self.load_draft,
-            bg=self.colors['secondary'],
-            fg='white',
-            font=('Arial', 10, 'bold'),
-            relief=tk.RAISED,
-            bd=2,
-            pady=5,
-            width=20
-        )
-        load_btn.pack(pady=(0, 10))
-
-        # Load previous month button
-        prev_btn = tk.Button(
-            draft_inner,
-            text="Load Previous Month",
-            command=self.load_previous_month,
-            bg=self.colors['secondary'],
-            fg='white',
-            font=('Arial', 10, 'bold'),
-            relief=tk.RAISED,
-            bd=2,
-            pady=5,
-            width=20
-        )
-        prev_btn.pack(pady=(0, 10))
-
-        # Save draft button
-        save_btn = tk.Button(
-            draft_inner,
-            text="Save Draft",
-            command=self.save_draft,
-            bg=self.colors['primary'],
-            fg='white',
-            font=('Arial', 11, 'bold'),
-            relief=tk.RAISED,
-            bd=3,
-            pady=8,
-            width=20
-        )
-        save_btn.pack()
-
-        # Preview Section
-        preview_section = tk.LabelFrame(
-            inner_frame,
-            text="Preview",
-            font=('Arial', 10, 'bold'),
-            bg=self.colors['bg_white']
-        )
-        preview_section.pack(fill=tk.X, pady=(0, 15))
-
-        preview_inner = tk.Frame(preview_section, bg=self.colors['bg_white'])
-        preview_inner.pack(padx=10, pady=10)
-
-        # Preview button
-        preview_btn = tk.Button(
-            preview_inner,
-            text="Preview with Sample Customer",
-            command=self.preview_email,
-            bg=self.colors['secondary'],
-            fg='white',
-            font=('Arial', 10, 'bold'),
-            relief=tk.RAISED,
-            bd=2,
-            pady=5,
-            width=24
-        )
-        preview_btn.pack()
-
-        # Generation Section
-        gen_section = tk.LabelFrame(
-            inner_frame,
-            text="Email Generation",
-            font=('Arial', 10, 'bold'),
-            bg=self.colors['bg_white']
-        )
-        gen_section.pack(fill=tk.X, pady=(0, 15))
-
-        gen_inner = tk.Frame(gen_section, bg=self.colors['bg_white'])
-        gen_inner.pack(padx=10, pady=10)
-
-        # Generate button
-        self.generate_btn = tk.Button(
-            gen_inner,
-            text="Generate All Email Drafts",
-            command=self.generate_all_drafts,
-            bg=self.colors['primary'],
-            fg='white',
-            font=('Arial', 12, 'bold'),
-            relief=tk.RAISED,
-            bd=3,
-            pady=10,
-            width=22
-        )
-        self.generate_btn.pack(pady=(0, 10))
+        # Draft Operations / Preview / Email Generation sections and
+        # their buttons come from one table; every button is a ttk.Button
+        # sharing the named styles configured in setup_ui
+        draft_inner = self._make_section(inner_frame, "Draft Operations")
+        preview_inner = self._make_section(inner_frame, "Preview")
+        gen_inner = self._make_section(inner_frame, "Email Generation")
+
+        button_specs = [
+            # (attr, parent, text, command, style, width, pady)
+            (None, draft_inner, "Load Draft", self.load_draft,
+             'Secondary.TButton', 20, (0, 10)),
+            (None, draft_inner, "Load Previous Month", self.load_previous_month,
+             'Secondary.TButton', 20, (0, 10)),
+            (None, draft_inner, "Save Draft", self.save_draft,
+             'Primary.TButton', 20, 0),
+            (None, preview_inner, "Preview with Sample Customer", self.preview_email,
+             'Secondary.TButton', 24, 0),
+            ('generate_btn', gen_inner, "Generate All Email Drafts", self.generate_all_drafts,
+             'Generate.TButton', 22, (0, 10)),
+        ]
+        for attr, btn_parent, text, command, style, width, pady in button_specs:
+            btn = ttk.Button(btn_parent, text=text, command=command,
+                             style=style, width=width)
+            btn.pack(pady=pady)
+            if attr:
+                setattr(self, attr, btn)
 
         # Progress bar
         self.progress_var = tk.IntVar(value=0)
@@ -348,15 +387,14 @@ class PriceSheetDashboard:
         )
         self.progress_bar.pack(pady=(0, 10))
 
-        # Status display
+        # Status display; fixed width with no wraplength so status
+        # updates during generation skip Tk's wrap recalculation
         self.status_var = tk.StringVar(value="Ready to generate drafts")
-        status_label = tk.Label(
+        status_label = ttk.Label(
             gen_inner,
             textvariable=self.status_var,
             font=('Arial', 9),
-            fg=self.colors['text_dark'],
-            bg=self.colors['bg_white'],
-            wraplength=250
+            width=40
         )
         status_label.pack()
 
@@ -418,11 +456,41 @@ class PriceSheetDashboard:
             debug_msg = f"[{timestamp}] {message}\n"
             self.debug_messages.append(debug_msg)
 
-            # Update debug text widget if it exists
+            # Buffer the line and schedule one flush; inserting (and
+            # forcing a redraw) per message makes tight generation loops
+            # spend most of their time in Tk
             if hasattr(self, 'debug_text'):
-                self.debug_text.insert(tk.END, debug_msg)
-                self.debug_text.see(tk.END)
-                self.root.update_idletasks()
+                self._debug_pending.append(debug_msg)
+                if not self._debug_flush_scheduled:
+                    self._debug_flush_scheduled = True
+                    self.root.after(50, self._flush_debug)
+
+    def _flush_debug(self):
+        """Insert all pending debug lines into the panel in one batch"""
+        self._debug_flush_scheduled = False
+        if self._debug_pending:
+            self.debug_text.insert(tk.END, ''.join(self._debug_pending))
+            self._debug_pending.clear()
+            # Trim the oldest lines once the widget exceeds the cap
+            total_lines = int(self.debug_text.index('end-1c').split('.')[0])
+            excess = total_lines - self.MAX_DEBUG_LINES
+            if excess > 0:
+                self.debug_text.delete('1.0', f'{excess + 1}.0')
+            self.debug_text.see(tk.END)
+
+    def _set_text(self, widget, new):
+        """Set a Text widget's content with the minimal edit.
+
+        Skips Tk entirely when nothing changed (e.g. flipping back to a
+        month already shown) and otherwise replaces only the span that
+        differs instead of rewriting the whole buffer.
+        """
+        old = widget.get('1.0', 'end-1c')
+        if old == new:
+            return
+        pre = len(os.path.commonprefix((old, new)))
+        suf = len(os.path.commonprefix((old[pre:][::-1], new[pre:][::-1])))
+        widget.replace(f'1.0+{pre}c', f'end-1c-{suf}c', new[pre:len(new) - suf])
 
     def on_date_changed(self, event=None):
         """Handle month/year selection change"""
@@ -436,24 +504,67 @@ class PriceSheetDashboard:
             year = int(self.year_var.get())
         return os.path.join(self.drafts_dir, f"{year}_{month:02d}.txt")
 
+    def _read_draft_file(self, path):
+        """Read a monthly draft file, cached on (path, mtime, size)"""
+        st = os.stat(path)
+        cache_key = (path, st.st_mtime, st.st_size)
+        content = self._draft_file_cache.get(cache_key)
+        if content is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            self._draft_file_cache[cache_key] = content
+        return content
+
+    def _load_templates(self):
+        """
+        Load email_templates.json, reusing the parsed dict until the
+        file changes on disk. Returns None when the file is missing.
+        """
+        templates_file = os.path.join(os.path.dirname(__file__), 'email_templates.json')
+        if not os.path.exists(templates_file):
+            return None
+        mtime = os.path.getmtime(templates_file)
+        if self._templates_cache is not None and self._templates_cache[0] == mtime:
+            return self._templates_cache[1]
+        with open(templates_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self._templates_cache = (mtime, data)
+        return data
+
     def load_draft(self):
-        """Load the draft for the selected month/year"""
+        """Load the draft for the selected month/year.
+
+        The read runs on the I/O pool so the UI never blocks on a slow
+        share; the result is applied back on the Tk thread.
+        """
         draft_file = self.get_draft_filename()
+        status = f"Loaded draft for {self.month_var.get()}/{self.year_var.get()}"
 
-        if os.path.exists(draft_file):
+        # Single open attempt instead of an exists() pre-check; saves a
+        # stat per date change and avoids the check-then-open race
+        def read_draft():
             try:
-                with open(draft_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.draft_text.delete(1.0, tk.END)
-                self.draft_text.insert(1.0, content)
-                self.status_var.set(f"Loaded draft for {self.month_var.get()}/{self.year_var.get()}")
-                self.add_debug_message(f"Loaded draft from: {draft_file}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load draft: {str(e)}")
-                self.add_debug_message(f"ERROR loading draft: {str(e)}")
-        else:
-            # Load default template
-            self.load_default_template()
+                content = self._read_draft_file(draft_file)
+            except FileNotFoundError:
+                # Load default template
+                self.root.after(0, self.load_default_template)
+            except OSError as e:
+                self.root.after(0, self._on_draft_load_failed, str(e))
+            else:
+                self.root.after(0, self._apply_loaded_draft, content, status, draft_file)
+
+        self._io_pool.submit(read_draft)
+
+    def _apply_loaded_draft(self, content, status, source_file):
+        """Show a loaded draft (runs on the UI thread)"""
+        self._set_text(self.draft_text, content)
+        self.status_var.set(status)
+        self.add_debug_message(f"Loaded draft from: {source_file}")
+
+    def _on_draft_load_failed(self, error):
+        """Report a failed draft read (runs on the UI thread)"""
+        messagebox.showerror("Error", f"Failed to load draft: {error}")
+        self.add_debug_message(f"ERROR loading draft: {error}")
 
     def load_default_template(self):
         """Load a default template for new drafts - WITHOUT signature"""
@@ -466,8 +577,7 @@ No change in pricing for {current_month}, as FX movement stayed within the 2% ba
 
 Thanks,"""
 
-        self.draft_text.delete(1.0, tk.END)
-        self.draft_text.insert(1.0, default_template)
+        self._set_text(self.draft_text, default_template)
         self.status_var.set(f"Loaded default template for {self.month_var.get()}/{self.year_var.get()}")
         self.add_debug_message("Loaded default template (signature will be added during generation)")
 
@@ -486,54 +596,61 @@ Thanks,"""
 
         prev_draft_file = self.get_draft_filename(prev_month, prev_year)
 
-        if os.path.exists(prev_draft_file):
+        def read_previous():
             try:
-                with open(prev_draft_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self._read_draft_file(prev_draft_file)
+            except FileNotFoundError:
+                self.root.after(0, messagebox.showwarning, "Warning",
+                                f"No draft found for previous month ({prev_month}/{prev_year})")
+            except OSError as e:
+                self.root.after(0, self._on_previous_load_failed, str(e))
+            else:
+                self.root.after(0, self._apply_previous_draft, content,
+                                prev_month, prev_year, prev_draft_file)
+
+        self._io_pool.submit(read_previous)
+
+    def _apply_previous_draft(self, content, prev_month, prev_year, source_file):
+        """Show the previous month's draft (runs on the UI thread)"""
+        # Strip any existing signature from the loaded content
+        content = self.strip_signature_from_content(content)
 
-                # Strip any existing signature from the loaded content
-                content = self.strip_signature_from_content(content)
+        self._set_text(self.draft_text, content)
+        self.status_var.set(f"Loaded previous month's draft ({prev_month}/{prev_year}) as template")
+        self.add_debug_message(f"Loaded previous draft from: {source_file}")
 
-                self.draft_text.delete(1.0, tk.END)
-                self.draft_text.insert(1.0, content)
-                self.status_var.set(f"Loaded previous month's draft ({prev_month}/{prev_year}) as template")
-                self.add_debug_message(f"Loaded previous draft from: {prev_draft_file}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load previous month's draft: {str(e)}")
-                self.add_debug_message(f"ERROR loading previous draft: {str(e)}")
-        else:
-            messagebox.showwarning("Warning", f"No draft found for previous month ({prev_month}/{prev_year})")
+    def _on_previous_load_failed(self, error):
+        """Report a failed previous-draft read (runs on the UI thread)"""
+        messagebox.showerror("Error", f"Failed to load previous month's draft: {error}")
+        self.add_debug_message(f"ERROR loading previous draft: {error}")
 
     def strip_signature_from_content(self, content):
         """Remove any existing signature from content to prevent duplication"""
-        # Look for common signature markers
-        signature_markers = [
-            "Mark Anderson",
-            "Managing Director",
-            "Valorem Chemicals",
-            "+61 417 725 006",
-            "marka@valorem.com.au"
-        ]
-
-        lines = content.split('\n')
-        signature_start = -1
-
-        # Find where signature starts
-        for i, line in enumerate(lines):
-            if any(marker in line for marker in signature_markers):
-                signature_start = i
-                break
-
-        if signature_start > 0:
-            # Remove everything from signature onwards
-            lines = lines[:signature_start]
-            self.add_debug_message(f"Stripped existing signature starting at line {signature_start}")
-
-        return '\n'.join(lines).rstrip()
+        key = hash(content)
+        cached = self._strip_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # One regex pass over the content instead of a substring scan of
+        # every marker against every line
+        result = content.rstrip()
+        match = self._sig_re.search(content)
+        if match:
+            line_start = content.rfind('\n', 0, match.start())
+            if line_start > 0:
+                # Remove everything from the signature line onwards
+                result = content[:line_start].rstrip()
+                signature_line = content.count('\n', 0, line_start) + 1
+                self.add_debug_message(f"Stripped existing signature starting at line {signature_line}")
+
+        if len(self._strip_cache) >= 16:
+            self._strip_cache.pop(next(iter(self._strip_cache)))
+        self._strip_cache[key] = result
+        return result
 
     def save_draft(self):
-        """Save the current draft"""
-        content = self.draft_text.get(1.0, tk.END).strip()
+        """Save the current draft (the write runs off the UI thread)"""
+        content = self._get_clean_content()
 
         if not content:
             messagebox.showwarning("Warning", "No content to save")
@@ -543,23 +660,37 @@ Thanks,"""
         content = self.strip_signature_from_content(content)
 
         draft_file = self.get_draft_filename()
+        month_name = _resolve_month_strings(int(self.month_var.get()), int(self.year_var.get())).month_name
+        year = self.year_var.get()
 
-        try:
-            with open(draft_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+        def write_draft():
+            # Write to a temp file and swap it in so a crash mid-write
+            # can never leave a truncated draft behind
+            tmp_file = draft_file + '.tmp'
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(tmp_file, draft_file)
+                self.root.after(0, self._on_draft_saved, draft_file, month_name, year)
+            except Exception as e:
+                self.root.after(0, self._on_draft_save_failed, str(e))
 
-            month_name = datetime(int(self.year_var.get()), int(self.month_var.get()), 1).strftime("%B")
-            self.status_var.set(f"Draft saved for {month_name} {self.year_var.get()}")
-            self.add_debug_message(f"Draft saved to: {draft_file}")
-            messagebox.showinfo("Success", f"Draft saved successfully for {month_name} {self.year_var.get()}")
+        self._io_pool.submit(write_draft)
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save draft: {str(e)}")
-            self.add_debug_message(f"ERROR saving draft: {str(e)}")
+    def _on_draft_saved(self, draft_file, month_name, year):
+        """Report a completed draft write (runs on the UI thread)"""
+        self.status_var.set(f"Draft saved for {month_name} {year}")
+        self.add_debug_message(f"Draft saved to: {draft_file}")
+        messagebox.showinfo("Success", f"Draft saved successfully for {month_name} {year}")
+
+    def _on_draft_save_failed(self, error):
+        """Report a failed draft write (runs on the UI thread)"""
+        messagebox.showerror("Error", f"Failed to save draft: {error}")
+        self.add_debug_message(f"ERROR saving draft: {error}")
 
     def preview_email(self):
         """Preview the email with sample customer data"""
-        content = self.draft_text.get(1.0, tk.END).strip()
+        content = self._get_clean_content()
 
         if not content:
             messagebox.showwarning("Warning", "No draft content to preview")
@@ -569,63 +700,90 @@ Thanks,"""
         content = self.strip_signature_from_content(content)
 
         # Get date values for placeholder replacement
-        month_num = int(self.month_var.get())
-        year_num = int(self.year_var.get())
-        current_date = datetime(year_num, month_num, 1)
-
-        month_name = current_date.strftime("%B")
-        previous_month = (current_date - relativedelta(months=1)).strftime("%B")
+        months = _resolve_month_strings(int(self.month_var.get()), int(self.year_var.get()))
 
         # Sample customer data with properly resolved values
         sample_values = {
             'customer_name': 'ABC Company Pty Ltd',
             'recipient_name': 'John Smith',
-            'month': month_name,
-            'current_month': month_name,  # Resolve {current_month} properly
-            'previous_month': previous_month,
+            'month': months.month_name,
+            'current_month': months.month_name,  # Resolve {current_month} properly
+            'previous_month': months.previous_month_name,
             'percentage': '3.5',
-            'effective_date': (current_date + relativedelta(months=1)).strftime("%B 1, %Y"),
+            'effective_date': months.next_month_effective,
             'reason': 'increased supplier costs'
         }
 
-        self.add_debug_message("Preview variables:")
-        for key, value in sample_values.items():
-            self.add_debug_message(f"  {{{key}}} → {value}")
-
-        # Replace placeholders
-        preview_content = content
-        for key, value in sample_values.items():
-            old_content = preview_content
-            preview_content = preview_content.replace(f"{{{key}}}", str(value))
-            if old_content != preview_content:
-                self.add_debug_message(f"Replaced {{{key}}} with '{value}'")
-
-        # Add signature for preview
-        signature = """
-
-Mark Anderson
-Managing Director
-Valorem Chemicals Pty Ltd
-+61 417 725 006
-marka@valorem.com.au
-www.valorem.com.au"""
-
-        preview_content += signature
-
-        # Display preview
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(1.0, f"PREVIEW - Sample Customer: {sample_values['customer_name']}\n")
-        self.preview_text.insert(tk.END, "="*60 + "\n\n")
-        self.preview_text.insert(tk.END, f"Subject: Monthly Pricing Update for {sample_values['customer_name']}\n\n")
-        self.preview_text.insert(tk.END, preview_content)
+        self.add_debug_message("Preview variables:\n" + '\n'.join(
+            f"  {{{key}}} → {value}" for key, value in sample_values.items()))
+
+        # Split the draft into literal/placeholder segments once per
+        # distinct content and cache the split; rendering is then a join
+        # with dict lookups instead of a regex scan per preview
+        cache_key = hash(content)
+        parts = self._preview_cache.get(cache_key)
+        if parts is None:
+            if len(self._preview_cache) >= 64:
+                # Drop the oldest fifth (dicts keep insertion order)
+                for old in list(self._preview_cache)[:13]:
+                    del self._preview_cache[old]
+            parts = _PLACEHOLDER_RE.split(content)
+            self._preview_cache[cache_key] = parts
+
+        # Odd indices are placeholder names from the split's capture group
+        replaced_keys = []
+        rendered = []
+        rendered_append = rendered.append
+        for i, part in enumerate(parts):
+            if i & 1:
+                if part in sample_values:
+                    replaced_keys.append(part)
+                    rendered_append(str(sample_values[part]))
+                else:
+                    rendered_append('{' + part + '}')
+            else:
+                rendered_append(part)
+        preview_content = ''.join(rendered)
+        if replaced_keys:
+            self.add_debug_message(
+                "Replaced placeholders: " + ', '.join(f"{{{key}}}" for key in replaced_keys))
+
+        # Display preview; one diffed update instead of four Tcl round-trips
+        self._set_text(self.preview_text, ''.join((
+            f"PREVIEW - Sample Customer: {sample_values['customer_name']}\n",
+            "=" * 60 + "\n\n",
+            f"Subject: Monthly Pricing Update for {sample_values['customer_name']}\n\n",
+            preview_content,
+            self.PREVIEW_SIGNATURE,
+        )))
 
         self.status_var.set("Preview updated with sample customer data")
 
     def update_progress(self, current, total, message):
-        """Update progress bar and status from background thread"""
-        self.progress_var.set(current)
-        self.status_var.set(message)
-        self.root.update_idletasks()
+        """Record progress from the worker; flushed at most every 50ms"""
+        self._pending_progress = (current, message)
+        if self._progress_flush_id is None:
+            self._progress_flush_id = self.root.after(50, self._flush_progress)
+
+    def _flush_progress(self):
+        """Apply the latest recorded progress to the bar and status"""
+        self._progress_flush_id = None
+        if self._pending_progress is not None:
+            current, message = self._pending_progress
+            self._pending_progress = None
+            self.progress_var.set(current)
+            self.status_var.set(message)
+
+    def _cancel_pending_progress(self):
+        """Drop any throttled progress update that hasn't flushed yet.
+
+        Called once generation results are in, so a flush scheduled by
+        the worker's last update can't overwrite the final status.
+        """
+        self._pending_progress = None
+        if self._progress_flush_id is not None:
+            self.root.after_cancel(self._progress_flush_id)
+            self._progress_flush_id = None
 
     def generate_all_drafts(self):
         """Generate all email drafts using the saved monthly template"""
@@ -633,7 +791,7 @@ www.valorem.com.au"""
         # User should manually save draft if needed before generation
 
         # Prepare the monthly draft as a custom template
-        content = self.draft_text.get(1.0, tk.END).strip()
+        content = self._get_clean_content()
 
         # IMPORTANT: Strip any signature from content before creating template
         content = self.strip_signature_from_content(content)
@@ -650,46 +808,60 @@ www.valorem.com.au"""
         self.generate_btn.config(state='disabled')
         self.progress_var.set(0)
 
-        try:
-            self.status_var.set("Preparing dashboard template...")
-            self.root.update()
+        # Widget and Tk variable access stays on the main thread; the
+        # template preparation and generation run in the worker so the
+        # UI never freezes during the prep phase
+        month_num = int(self.month_var.get())
+        year_num = int(self.year_var.get())
+        self.status_var.set("Generating email drafts...")
 
-            # Get current month details
-            month_num = int(self.month_var.get())
-            year_num = int(self.year_var.get())
-            current_date = datetime(year_num, month_num, 1)
-            month_name = current_date.strftime("%B")
+        self._gen_pool.submit(self._generate_in_background, content, month_num, year_num)
+
+    def _generate_in_background(self, content, month_num, year_num):
+        """Prepare the dashboard template and generate drafts (worker thread)"""
+        # Deferred so the heavy pandas/pywin32 import chain loads in the
+        # worker on first use instead of delaying the window open
+        from src import email_generator
+
+        def debug(message):
+            self.root.after(0, self.add_debug_message, message)
+
+        try:
+            month_name = _resolve_month_strings(month_num, year_num).month_name
 
             # Load existing email_templates.json to get signature info
-            templates_file = os.path.join(os.path.dirname(__file__), 'email_templates.json')
+            # (cached on mtime, so repeat generations skip the parse)
             signature_info = {}
             default_values = {}
 
-            if os.path.exists(templates_file):
-                with open(templates_file, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-                    signature_info = existing_data.get('signature', {})
-                    default_values = existing_data.get('default_values', {})
-                    self.add_debug_message("Loaded signature and default values from email_templates.json")
+            existing_data = self._load_templates()
+            if existing_data is not None:
+                signature_info = existing_data.get('signature', {})
+                default_values = existing_data.get('default_values', {})
+                debug("Loaded signature and default values from email_templates.json")
 
             # Fix Bug 2: Properly resolve date placeholders BEFORE creating template
             # Use SELECTED month/year, not system date
-            self.add_debug_message(f"Using selected date: {month_name} {year_num} (Month #{month_num})")
+            debug(f"Using selected date: {month_name} {year_num} (Month #{month_num})")
             date_placeholders = email_generator.get_date_placeholders(month_num, year_num)
 
-            # Override default_values with actual resolved dates
-            resolved_values = {}
-            for key, value in default_values.items():
-                if isinstance(value, str) and '{' in value and '}' in value:
-                    # This is a placeholder that needs resolution
-                    placeholder_key = value.strip('{}')
-                    if placeholder_key in date_placeholders:
-                        resolved_values[key] = date_placeholders[placeholder_key]
-                        self.add_debug_message(f"Resolved {key}: {value} → {resolved_values[key]}")
-                    else:
-                        resolved_values[key] = value
-                else:
-                    resolved_values[key] = value
+            # Override default_values with actual resolved dates; a value
+            # resolves when it is exactly one {placeholder} token that
+            # names a date placeholder
+            resolved_values = {
+                key: date_placeholders[match.group(1)]
+                if (isinstance(value, str)
+                    and (match := _PLACEHOLDER_RE.fullmatch(value))
+                    and match.group(1) in date_placeholders)
+                else value
+                for key, value in default_values.items()
+            }
+            resolved_keys = [key for key in resolved_values
+                            if resolved_values[key] != default_values[key]]
+            if resolved_keys:
+                debug("Resolved placeholders:\n" + '\n'.join(
+                    f"  {key}: {default_values[key]} → {resolved_values[key]}"
+                    for key in resolved_keys))
 
             # Merge with actual date values
             resolved_values.update(date_placeholders)
@@ -698,9 +870,8 @@ www.valorem.com.au"""
             resolved_values['selected_month'] = month_num
             resolved_values['selected_year'] = year_num
 
-            self.add_debug_message("Final resolved values:")
-            for key, value in resolved_values.items():
-                self.add_debug_message(f"  {key}: {value}")
+            debug("Final resolved values:\n" + '\n'.join(
+                f"  {key}: {value}" for key, value in resolved_values.items()))
 
             # Create dashboard template WITHOUT signature in content
             custom_template = {
@@ -717,52 +888,49 @@ www.valorem.com.au"""
                 "default_values": resolved_values  # Use resolved values, not placeholders
             }
 
-            # Save as dashboard template file
+            # Save as dashboard template file. The file is only read back
+            # by email_generator, so skip stdlib pretty-printing; orjson
+            # is used when available, compact json otherwise
             temp_template_file = os.path.join(self.drafts_dir, 'dashboard_template.json')
-            with open(temp_template_file, 'w', encoding='utf-8') as f:
-                json.dump(custom_template, f, indent=2)
-
-            self.add_debug_message(f"Dashboard template saved to: {temp_template_file}")
-            self.add_debug_message("Signature will be added by email_generator module")
-
-            self.status_var.set("Generating email drafts...")
-            self.root.update()
-
-            # Run email generation in a background thread to keep UI responsive
-            def generate_in_background():
-                try:
-                    # Call the email generator with resolved values
-                    results = email_generator.create_email_drafts_batch(
-                        template_key='dashboard_custom',
-                        custom_values=resolved_values,  # Pass resolved values
-                        progress_callback=lambda curr, total, msg: self.root.after(0, self.update_progress, curr, total, msg)
-                    )
-
-                    # Update UI with results in main thread
-                    self.root.after(0, self.display_generation_results, results)
-
-                except Exception as e:
-                    error_msg = f"Failed to generate drafts: {str(e)}"
-                    self.root.after(0, lambda: self.add_debug_message(f"ERROR: {error_msg}"))
-                    self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
-                    self.root.after(0, lambda: self.status_var.set("Error occurred during generation"))
-                finally:
-                    self.root.after(0, lambda: self.generate_btn.config(state='normal'))
-
-            # Start background thread
-            thread = threading.Thread(target=generate_in_background, daemon=True)
-            thread.start()
+            if orjson is not None:
+                payload = orjson.dumps(custom_template)
+            else:
+                payload = json.dumps(
+                    custom_template, separators=(',', ':'), ensure_ascii=False
+                ).encode('utf-8')
+            with open(temp_template_file, 'wb') as f:
+                f.write(payload)
+
+            debug(f"Dashboard template saved to: {temp_template_file}")
+            debug("Signature will be added by email_generator module")
+
+            # Call the email generator with resolved values
+            results = email_generator.create_email_drafts_batch(
+                template_key='dashboard_custom',
+                custom_values=resolved_values,  # Pass resolved values
+                progress_callback=lambda curr, total, msg: self.root.after(0, self.update_progress, curr, total, msg)
+            )
+
+            # Update UI with results in main thread
+            self.root.after(0, self.display_generation_results, results)
 
         except Exception as e:
-            error_msg = f"Failed to prepare template: {str(e)}"
-            self.add_debug_message(f"ERROR: {error_msg}")
-            messagebox.showerror("Error", error_msg)
-            self.status_var.set("Error occurred during preparation")
-            self.generate_btn.config(state='normal')
+            error_msg = f"Failed to generate drafts: {str(e)}"
+            debug(f"ERROR: {error_msg}")
+            self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
+
+            def show_error_status():
+                self._cancel_pending_progress()
+                self.status_var.set("Error occurred during generation")
+
+            self.root.after(0, show_error_status)
+        finally:
+            self.root.after(0, lambda: self.generate_btn.config(state='normal'))
 
     def display_generation_results(self, results):
         """Display the results of email generation"""
-        month_name = datetime(int(self.year_var.get()), int(self.month_var.get()), 1).strftime("%B")
+        self._cancel_pending_progress()
+        month_name = _resolve_month_strings(int(self.month_var.get()), int(self.year_var.get())).month_name
 
         if results['success']:
             self.add_debug_message(f"Generation complete: {results['drafts_created']} drafts created")
@@ -778,20 +946,17 @@ www.valorem.com.au"""
                 "Please review them before sending."
             )
 
-            # Show details in debug if enabled
+            # Show details in debug if enabled; one message for the batch
             if self.debug_mode.get() and results['details']:
-                self.add_debug_message("\nDraft Details:")
-                for detail in results['details']:
-                    if detail['status'] == 'success':
-                        self.add_debug_message(f"  ✓ {detail['customer']}")
-                    else:
-                        self.add_debug_message(f"  ✗ {detail['customer']}: {detail.get('error', 'Unknown error')}")
+                self.add_debug_message("\nDraft Details:\n" + '\n'.join(
+                    f"  ✓ {detail['customer']}"
+                    if detail['status'] == 'success'
+                    else f"  ✗ {detail['customer']}: {detail.get('error', 'Unknown error')}"
+                    for detail in results['details']))
         else:
-            self.add_debug_message(f"Generation failed with {len(results['errors'])} errors")
-
-            # Display errors
-            for error in results['errors']:
-                self.add_debug_message(f"ERROR: {error}")
+            self.add_debug_message(
+                f"Generation failed with {len(results['errors'])} errors\n"
+                + '\n'.join(f"ERROR: {error}" for error in results['errors']))
 
             self.status_var.set("Generation failed - see debug output")
 
@@ -804,6 +969,12 @@ www.valorem.com.au"""
                 f"Debug log: {results.get('debug_log', 'N/A')}"
             )
 
+    def on_close(self):
+        """Shut down the worker pools and close the window"""
+        self._io_pool.shutdown(wait=False)
+        self._gen_pool.shutdown(wait=False)
+        self.root.destroy()
+
     def run(self):
         """Run the dashboard"""
         # Load the current month's draft on startup
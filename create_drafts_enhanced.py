@@ -1,27 +1,96 @@
 import win32com.client
+import pythoncom
 import pandas as pd
+import html
 import os
 import json
+import re
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.message import EmailMessage
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
+from functools import lru_cache
 
+# Faster JSON parse for the template files when orjson is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once at import; per-call re.compile/lookup adds up in the
+# interactive path
+_PLACEHOLDER_RE = re.compile(r'\{([^}]+)\}')
+
+# Worksheet columns the draft loop consumes; everything else is skipped
+# at parse time via usecols
+_NEEDED_COLUMNS = {'CustomerName', 'RecipientName', 'EmailAddresses', 'FilePath', 'FileName'}
+
+# Draft creation is bound by COM round-trip latency, not CPU, so a small
+# pool of threads overlaps the MAPI waits; kept low because Outlook can
+# serialize at the store level
+_MAX_DRAFT_WORKERS = 4
+
+# Same CC line on every draft
+_CC_ADDRESSES = "support@valorem.com.au;jasonn@valorem.com.au"
+
+# Signature block and outer envelope parsed once at import; per call the
+# body builder only substitutes values instead of re-assembling f-strings
+_SIG_TEMPLATE = string.Template("""
+    <p>
+        <strong>${name}</strong><br>
+        ${title}<br>
+        <strong style="color: ${company_color};">${company}</strong><br>
+        Phone: ${phone}<br>
+        Email: ${email}<br>
+        Web: ${website}
+    </p>
+    """)
+
+_HTML_ENVELOPE = """
+    <html>
+        <body style="font-family: Arial, sans-serif;">
+            %s
+
+            %s
+
+            <p style="font-size: 10px;">
+                This email and any files transmitted with it are confidential and
+                intended solely for the use of the individual or entity to whom they are addressed.
+            </p>
+        </body>
+    </html>
+    """
+
+def _read_json(path):
+    """Parse a JSON file, with orjson when available"""
+    # Both parsers take UTF-8 bytes directly, so one binary read serves
+    # either branch without a decode pass
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+@lru_cache(maxsize=1)
 def load_email_templates():
-    """Load email templates from JSON file"""
+    """Load email templates from JSON file.
+
+    Cached for the session so repeated calls skip the disk reads and
+    JSON parsing; call load_email_templates.cache_clear() to force a
+    reload.
+    """
     try:
         templates_file = os.path.join(os.path.dirname(__file__), 'email_templates.json')
-        with open(templates_file, 'r', encoding='utf-8') as f:
-            templates_data = json.load(f)
+        templates_data = _read_json(templates_file)
 
         # Check for dashboard template
         dashboard_template_file = os.path.join(os.path.dirname(__file__), 'monthly_drafts', 'dashboard_template.json')
         if os.path.exists(dashboard_template_file):
             try:
-                with open(dashboard_template_file, 'r', encoding='utf-8') as f:
-                    dashboard_data = json.load(f)
-                    # Merge dashboard templates with existing templates
-                    templates_data['templates'].update(dashboard_data.get('templates', {}))
-                    print("✓ Dashboard template loaded")
+                dashboard_data = _read_json(dashboard_template_file)
+                # Merge dashboard templates with existing templates
+                templates_data['templates'].update(dashboard_data.get('templates', {}))
+                print("✓ Dashboard template loaded")
             except Exception as e:
                 print(f"⚠ Error loading dashboard template: {e}")
 
@@ -29,7 +98,7 @@ def load_email_templates():
     except FileNotFoundError:
         print("⚠ email_templates.json not found. Using default template.")
         return create_default_template()
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
         print(f"⚠ Error reading email_templates.json: {e}. Using default template.")
         return create_default_template()
 
@@ -59,26 +128,56 @@ def create_default_template():
         }
     }
 
-def get_date_placeholders():
-    """Generate date-based placeholder values"""
-    today = date.today()
-    current_month = today.strftime("%B")
-    previous_month = (today.replace(day=1) - relativedelta(months=1)).strftime("%B")
-    first_of_next_month = (today.replace(day=1) + relativedelta(months=1)).strftime("%B 1, %Y")
-    
+def _iter_strings(obj):
+    """Yield every string leaf in a nested template structure"""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from _iter_strings(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _iter_strings(value)
+
+def _substitute(text, values):
+    """
+    Fill {placeholder} tokens in one pass with the precompiled regex.
+    Cheaper than str.format, which re-parses the format mini-language on
+    every call, and unknown placeholders are left intact instead of
+    raising KeyError.
+    """
+    return _PLACEHOLDER_RE.sub(lambda m: str(values.get(m.group(1), m.group(0))), text)
+
+# Month names indexed by date.month; avoids strftime re-parsing "%B"
+_MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November', 'December')
+
+@lru_cache(maxsize=4)
+def _date_placeholders_for(ordinal):
+    """Compute date placeholders for a given day (the result only changes
+    once per day, so it is cached on the day's ordinal)"""
+    today = date.fromordinal(ordinal)
+    current_month = _MONTH_NAMES[today.month - 1]
+    previous_month = _MONTH_NAMES[(today.replace(day=1) - relativedelta(months=1)).month - 1]
+    first_of_next = today.replace(day=1) + relativedelta(months=1)
+
     # Calculate end of quarter
     quarter = (today.month - 1) // 3 + 1
     end_of_quarter_month = quarter * 3
     end_of_quarter = date(today.year, end_of_quarter_month, 1) + relativedelta(months=1, days=-1)
-    
+
     return {
         "current_month": current_month,
         "previous_month": previous_month,
-        "first_of_next_month": first_of_next_month,
-        "end_of_quarter": end_of_quarter.strftime("%B %d, %Y"),
+        "first_of_next_month": f"{_MONTH_NAMES[first_of_next.month - 1]} 1, {first_of_next.year}",
+        "end_of_quarter": f"{_MONTH_NAMES[end_of_quarter.month - 1]} {end_of_quarter.day:02d}, {end_of_quarter.year}",
         "month": current_month
     }
 
+def get_date_placeholders():
+    """Generate date-based placeholder values"""
+    return _date_placeholders_for(date.today().toordinal())
+
 def display_available_templates(templates_data):
     """Display all available templates for user selection"""
     print("\n" + "="*60)
@@ -121,28 +220,30 @@ def get_template_selection(available_templates, templates_data):
 
 def customize_template_values(template, templates_data):
     """Allow user to customize template placeholder values"""
-    print("\n" + "="*60)
-    print("CUSTOMIZE TEMPLATE VALUES")
-    print("="*60)
-    
     # Get default date values
     date_values = get_date_placeholders()
     default_values = templates_data.get('default_values', {})
-    
+
     # Merge date values with defaults
     custom_values = {**date_values, **default_values}
-    
-    # Find placeholders in the template
-    template_str = json.dumps(template)
-    placeholders = []
-    import re
-    placeholder_pattern = r'\{([^}]+)\}'
-    found_placeholders = set(re.findall(placeholder_pattern, template_str))
-    
+
+    # Find placeholders by walking the template's string leaves directly
+    # (no need to serialize the whole dict to JSON first)
+    found_placeholders = set()
+    for text in _iter_strings(template):
+        found_placeholders.update(_PLACEHOLDER_RE.findall(text))
+
     # Remove standard placeholders that come from Excel data
     excel_placeholders = {'customer_name', 'recipient_name'}
     customizable_placeholders = found_placeholders - excel_placeholders
-    
+
+    # Nothing to prompt for - skip the interactive loop entirely
+    if not customizable_placeholders:
+        return custom_values
+
+    print("\n" + "="*60)
+    print("CUSTOMIZE TEMPLATE VALUES")
+    print("="*60)
     print("Current values (press Enter to keep current value):")
     print("-" * 60)
     
@@ -155,6 +256,54 @@ def customize_template_values(template, templates_data):
     
     return custom_values
 
+def _format_body_parts(template, all_values):
+    """
+    Format the template body strings once. Shared by the HTML builder
+    and the plain-text preview, so each output formats the source
+    exactly once.
+    """
+    body = template.get('body', {})
+
+    # Dashboard templates carry a single 'content' field
+    if 'content' in body:
+        return {'content': _substitute(body.get('content', ''), all_values)}
+
+    return {
+        'greeting': _substitute(body.get('greeting', 'Hi {recipient_name},'), all_values),
+        'main_message': _substitute(body.get('main_message', ''), all_values),
+        'pricing_note': _substitute(body.get('pricing_note', ''), all_values),
+        'closing': _substitute(body.get('closing', 'Thanks,'), all_values)
+    }
+
+def build_text_preview(template, signature, custom_values, customer_name, recipient_name):
+    """
+    Build a plain-text preview straight from the template, instead of
+    rendering the full HTML body and regex-stripping the tags back out.
+    """
+    all_values = {**custom_values,
+                  'customer_name': customer_name,
+                  'recipient_name': recipient_name}
+    parts = _format_body_parts(template, all_values)
+
+    if 'content' in parts:
+        body_text = parts['content']
+    else:
+        body_text = '\n\n'.join(part for part in (
+            parts['greeting'], parts['main_message'],
+            parts['pricing_note'], parts['closing']
+        ) if part)
+
+    signature_text = '\n'.join([
+        signature.get('name', 'Mark Anderson'),
+        signature.get('title', 'Managing Director'),
+        signature.get('company', 'Valorem Chemicals Pty Ltd'),
+        f"Phone: {signature.get('phone', '+61 417 725 006')}",
+        f"Email: {signature.get('email', 'marka@valorem.com.au')}",
+        f"Web: {signature.get('website', 'www.valorem.com.au')}"
+    ])
+
+    return f"{body_text}\n\n{signature_text}"
+
 def build_html_email_body(template, signature, custom_values, customer_name, recipient_name):
     """Build the HTML email body from template"""
 
@@ -165,62 +314,132 @@ def build_html_email_body(template, signature, custom_values, customer_name, rec
         'recipient_name': recipient_name
     })
 
-    # Get template body parts
-    body = template.get('body', {})
+    parts = _format_body_parts(template, all_values)
 
     # Check if this is a dashboard template (has single 'content' field)
-    if 'content' in body:
-        # Dashboard template - format the entire content
-        content_html = body.get('content', '').format(**all_values)
-        # Convert line breaks to HTML
-        content_html = content_html.replace('\n', '<br>')
+    if 'content' in parts:
+        # Dashboard template - convert line breaks to HTML
+        content_html = parts['content'].replace('\n', '<br>')
         body_content = f"<p>{content_html}</p>"
     else:
-        # Standard template - use structured fields
-        greeting = body.get('greeting', 'Hi {recipient_name},').format(**all_values)
-        main_message = body.get('main_message', '').format(**all_values)
-        pricing_note = body.get('pricing_note', '').format(**all_values)
-        closing = body.get('closing', 'Thanks,').format(**all_values)
-
         body_content = f"""
-            <p>{greeting}</p>
+            <p>{parts['greeting']}</p>
 
-            <p>{main_message}</p>
+            <p>{parts['main_message']}</p>
 
-            <p>{pricing_note}</p>
+            <p>{parts['pricing_note']}</p>
 
-            <p>{closing}</p>
+            <p>{parts['closing']}</p>
         """
 
-    # Build signature
-    sig_html = f"""
-    <p>
-        <strong>{signature.get('name', 'Mark Anderson')}</strong><br>
-        {signature.get('title', 'Managing Director')}<br>
-        <strong style="color: {signature.get('company_color', 'rgb(74, 144, 226)')};">{signature.get('company', 'Valorem Chemicals Pty Ltd')}</strong><br>
-        Phone: {signature.get('phone', '+61 417 725 006')}<br>
-        Email: {signature.get('email', 'marka@valorem.com.au')}<br>
-        Web: {signature.get('website', 'www.valorem.com.au')}
-    </p>
-    """
+    # Build signature from the precompiled template
+    sig_html = _SIG_TEMPLATE.substitute(
+        name=signature.get('name', 'Mark Anderson'),
+        title=signature.get('title', 'Managing Director'),
+        company=signature.get('company', 'Valorem Chemicals Pty Ltd'),
+        company_color=signature.get('company_color', 'rgb(74, 144, 226)'),
+        phone=signature.get('phone', '+61 417 725 006'),
+        email=signature.get('email', 'marka@valorem.com.au'),
+        website=signature.get('website', 'www.valorem.com.au')
+    )
 
     # Combine into full HTML
-    html_body = f"""
-    <html>
-        <body style="font-family: Arial, sans-serif;">
-            {body_content}
+    return _HTML_ENVELOPE % (body_content, sig_html)
+
+def _create_draft_worker(row, body_skeleton, subject_skeleton):
+    """
+    Create one Outlook draft on a worker thread. Outlook automation
+    objects are apartment-threaded, so each worker initializes COM and
+    dispatches its own Application handle. Returns (success, messages).
+    """
+    pythoncom.CoInitialize()
+    try:
+        outlook = win32com.client.Dispatch("Outlook.Application")
+        messages = []
 
-            {sig_html}
+        mail = outlook.CreateItem(0)  # 0 = Mail item
+        mail.To = row.EmailAddresses
+        mail.CC = _CC_ADDRESSES
+        mail.Subject = subject_skeleton.replace('__CUSTOMER__', row.CustomerName)
+        # Escape the two injected names so '&', '<' etc. in customer data
+        # can't malform the HTML body (the subject is plain text)
+        mail.HTMLBody = (body_skeleton
+                         .replace('__CUSTOMER__', html.escape(row.CustomerName))
+                         .replace('__RECIPIENT__', html.escape(row.RecipientName)))
 
-            <p style="font-size: 10px;">
-                This email and any files transmitted with it are confidential and
-                intended solely for the use of the individual or entity to whom they are addressed.
-            </p>
-        </body>
-    </html>
+        # Attach the local file (path and existence precomputed per row)
+        if row.FullPath:
+            if row.Exists:
+                mail.Attachments.Add(row.FullPath)
+            else:
+                messages.append(f"⚠ File not found for {row.CustomerName}: {row.FullPath}")
+
+        # Save as draft (not send)
+        mail.Save()
+
+        attached_file = "No file specified"
+        if row.FullPath:
+            attached_file = row.FileName if row.Exists else f"{row.FileName} (FILE NOT FOUND!)"
+
+        messages.append(f"✓ Created draft for {row.CustomerName} ({row.EmailAddresses}) - Attached: {attached_file}")
+        return True, messages
+
+    except Exception as e:
+        return False, [f"✗ Error creating draft for {row.CustomerName}: {str(e)}"]
+
+    finally:
+        pythoncom.CoUninitialize()
+
+def export_drafts_as_eml(df, body_skeleton, subject_skeleton, output_dir):
     """
+    Bulk alternative to COM draft creation: write one .eml file per
+    customer into output_dir, skipping every per-item MAPI round-trip.
+    The X-Unsent header makes Outlook open the files in compose mode.
+    Opt-in via the PRICE_SENDER_EML_DIR environment variable, because the
+    files reach the Drafts folder only where an EML import flow exists;
+    the COM path stays the default.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written = 0
+
+    for row in df.itertuples(index=False):
+        msg = EmailMessage()
+        msg['To'] = row.EmailAddresses
+        msg['Cc'] = _CC_ADDRESSES
+        msg['Subject'] = subject_skeleton.replace('__CUSTOMER__', row.CustomerName)
+        msg['X-Unsent'] = '1'
+        msg.add_alternative(
+            body_skeleton
+            .replace('__CUSTOMER__', html.escape(row.CustomerName))
+            .replace('__RECIPIENT__', html.escape(row.RecipientName)),
+            subtype='html'
+        )
+
+        if row.FullPath and row.Exists:
+            with open(row.FullPath, 'rb') as f:
+                msg.add_attachment(f.read(), maintype='application',
+                                   subtype='pdf', filename=row.FileName)
+        elif row.FullPath:
+            print(f"⚠ File not found for {row.CustomerName}: {row.FullPath}")
+
+        safe_name = re.sub(r'[^\w\- ]', '_', row.CustomerName) or 'draft'
+        with open(os.path.join(output_dir, f"{safe_name}.eml"), 'wb') as f:
+            f.write(msg.as_bytes())
 
-    return html_body
+        print(f"✓ Wrote draft for {row.CustomerName} ({row.EmailAddresses})")
+        written += 1
+
+    return written
+
+def precompile_email_body(template, signature, custom_values):
+    """
+    Build the HTML body once with sentinel placeholders for the two
+    per-customer fields. Only customer_name/recipient_name vary between
+    rows, so the draft loop just swaps the sentinels instead of
+    re-formatting the whole template per customer.
+    """
+    return build_html_email_body(template, signature, custom_values,
+                                 '__CUSTOMER__', '__RECIPIENT__')
 
 def create_email_drafts():
     """
@@ -247,23 +466,17 @@ def create_email_drafts():
     print("TEMPLATE PREVIEW")
     print("="*60)
     
-    preview_subject = selected_template.get('subject', '').format(
-        customer_name="[CUSTOMER NAME]", **custom_values
-    )
+    preview_subject = _substitute(selected_template.get('subject', ''),
+                                  {**custom_values, 'customer_name': "[CUSTOMER NAME]"})
     print(f"Subject: {preview_subject}")
     
-    preview_html = build_html_email_body(
-        selected_template, 
+    preview_text = build_text_preview(
+        selected_template,
         templates_data.get('signature', {}),
         custom_values,
         "[CUSTOMER NAME]",
         "[RECIPIENT NAME]"
     )
-    
-    # Convert HTML to text for preview
-    import re
-    preview_text = re.sub(r'<[^>]+>', '', preview_html)
-    preview_text = re.sub(r'\n\s*\n', '\n\n', preview_text.strip())
     print(f"\nBody Preview:\n{preview_text}")
     
     print("\n" + "="*60)
@@ -277,14 +490,31 @@ def create_email_drafts():
     print("CREATING EMAIL DRAFTS")
     print("="*60)
     print("Connecting to Outlook...")
-    outlook = win32com.client.Dispatch("Outlook.Application")
+    # Early binding: generated wrappers invoke by DISPID instead of
+    # resolving property names on every COM call, which matters for the
+    # property-heavy MailItem population below
+    try:
+        outlook = win32com.client.gencache.EnsureDispatch("Outlook.Application")
+    except Exception:
+        # Fall back to late binding if the gen_py cache cannot be built
+        outlook = win32com.client.Dispatch("Outlook.Application")
     
     # Step 2: Read customer data from Excel
     excel_file = r"C:\Users\MarkAnderson\Valorem\Knowledge Hub - Documents\Pricing\Customer Price Lists\Price Sheet Sending_Python\Python_CustomerPricing.xlsx"
     print(f"Reading customer data from {excel_file}")
     
-    # Read the Excel file - the headers are on row 3 (0-indexed)
-    df = pd.read_excel(excel_file, header=3)
+    # Read the Excel file - the headers are on row 3 (0-indexed).
+    # usecols limits parsing to the consumed columns (matched on stripped
+    # names) and dtype=str skips the type-inference pass; calamine parses
+    # .xlsx several times faster than openpyxl when it is installed
+    try:
+        import python_calamine  # noqa: F401
+        engine = 'calamine'
+    except ImportError:
+        engine = 'openpyxl'
+    df = pd.read_excel(excel_file, header=3,
+                       usecols=lambda c: str(c).strip() in _NEEDED_COLUMNS,
+                       dtype=str, engine=engine)
 
     # Clean column names (remove any trailing spaces)
     df.columns = df.columns.str.strip()
@@ -293,59 +523,63 @@ def create_email_drafts():
     print(f"Found columns: {', '.join(df.columns)}")
     print(f"Found {len(df)} customer records\n")
 
+    # Narrow to the columns the loop reads and clean them once, so the
+    # loop below never strips or NaN-guards per row
+    cols = ['EmailAddresses', 'CustomerName', 'RecipientName', 'FilePath', 'FileName']
+    df = df[[c for c in cols if c in df.columns]].fillna('')
+    df['FilePath'] = df['FilePath'].str.strip()
+    df['FileName'] = df['FileName'].str.strip()
+
+    # One directory listing per unique folder replaces a stat syscall
+    # per row (the price-sheet folders live on a synced drive)
+    folder_files = {}
+    for folder in df['FilePath'].unique():
+        if folder:
+            folder_files[folder] = set(os.listdir(folder)) if os.path.isdir(folder) else set()
+
+    # Precompute the joined attachment path and its existence flag in one
+    # batched pass; workers then read two columns instead of joining and
+    # probing per draft
+    df['FullPath'] = [os.path.join(folder, name) if folder and name else ''
+                      for folder, name in zip(df['FilePath'], df['FileName'])]
+    df['Exists'] = [bool(path) and name in folder_files.get(folder, ())
+                    for folder, name, path in zip(df['FilePath'], df['FileName'], df['FullPath'])]
+
     # Step 3: Create a draft for each customer
     drafts_created = 0
-    
-    for index, row in df.iterrows():
-        try:
-            # Create a new email draft
-            mail = outlook.CreateItem(0)  # 0 = Mail item
-            
-            # Set the recipients
-            mail.To = row['EmailAddresses']
-            
-            # Set CC and BCC if needed
-            mail.CC = "support@valorem.com.au;jasonn@valorem.com.au"
-            
-            # Set the subject using template
-            subject_values = custom_values.copy()
-            subject_values['customer_name'] = row['CustomerName']
-            mail.Subject = selected_template.get('subject', 'Monthly Pricing Update for {customer_name}').format(**subject_values)
-            
-            # Create the HTML body using template
-            mail.HTMLBody = build_html_email_body(
-                selected_template,
-                templates_data.get('signature', {}),
-                custom_values,
-                row['CustomerName'],
-                row['RecipientName']
-            )
-            
-            # Attach the local file (FilePath = folder, FileName = filename)
-            folder   = row.get('FilePath', '').strip()
-            filename = row.get('FileName', '').strip()
-            if folder and filename:
-                fullpath = os.path.join(folder, filename)
-                if os.path.exists(fullpath):
-                    mail.Attachments.Add(fullpath)
-                else:
-                    print(f"⚠ File not found for {row['CustomerName']}: {fullpath}")
-            
-            # Save as draft (not send)
-            mail.Save()
-            
-            # Show what file was attached (or attempted to be attached)
-            attached_file = "No file specified"
-            if folder and filename:
-                attached_file = filename
-                if not os.path.exists(os.path.join(folder, filename)):
-                    attached_file = f"{filename} (FILE NOT FOUND!)"
-
-            print(f"✓ Created draft for {row['CustomerName']} ({row['EmailAddresses']}) - Attached: {attached_file}")
-            drafts_created += 1
-            
-        except Exception as e:
-            print(f"✗ Error creating draft for {row['CustomerName']}: {str(e)}")
+
+    # Format the body and subject once with sentinels; per row only the
+    # customer/recipient strings are swapped in
+    body_skeleton = precompile_email_body(
+        selected_template, templates_data.get('signature', {}), custom_values
+    )
+    subject_skeleton = _substitute(
+        selected_template.get('subject', 'Monthly Pricing Update for {customer_name}'),
+        {**custom_values, 'customer_name': '__CUSTOMER__'}
+    )
+
+    # Bulk filesystem path: write .eml files instead of COM drafts when
+    # PRICE_SENDER_EML_DIR points at a pickup folder
+    eml_dir = os.environ.get('PRICE_SENDER_EML_DIR')
+    if eml_dir:
+        written = export_drafts_as_eml(df, body_skeleton, subject_skeleton, eml_dir)
+        print(f"\nCompleted! Wrote {written} .eml drafts to {eml_dir}.")
+        print("Open or import them in Outlook to review before sending.")
+        return
+
+    # Drafts are created on a small thread pool: the loop is I/O-bound
+    # on Outlook COM round-trips, so overlapping them hides the latency.
+    # itertuples keeps rows as plain namedtuples for the workers.
+    with ThreadPoolExecutor(max_workers=_MAX_DRAFT_WORKERS) as pool:
+        futures = [pool.submit(_create_draft_worker, row,
+                               body_skeleton, subject_skeleton)
+                   for row in df.itertuples(index=False)]
+        for future in as_completed(futures):
+            success, messages = future.result()
+            for message in messages:
+                print(message)
+            if success:
+                drafts_created += 1
     
     print(f"\nCompleted! Created {drafts_created} draft emails using '{selected_template.get('name', template_key)}' template.")
     print("Check your Outlook Drafts folder to review before sending.")
@@ -19,18 +19,69 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import os
 import json
+import queue
 import sys
+import time
+from collections import deque
+from contextlib import nullcontext
 from datetime import date, datetime
+from pathlib import Path
 from dateutil.relativedelta import relativedelta
 import pandas as pd
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PIL import Image, ImageTk
 from src import email_generator
 from src.verification_system import MultiLayerVerificationSystem, CustomerDatabase
 
+# Console separators; built once instead of per loop iteration
+SEP_60 = "=" * 60
+SEP_40 = "-" * 40
+
+# Month names hoisted so handlers index a tuple instead of rebuilding a
+# list and scanning it with index() per call
+MONTHS = ('January', 'February', 'March', 'April', 'May', 'June',
+          'July', 'August', 'September', 'October', 'November', 'December')
+MONTH_IDX = {name: i for i, name in enumerate(MONTHS)}
+
+# Constant UI data hoisted to module scope so it is allocated once at
+# import time rather than per dashboard instantiation
+COLORS = {
+    'primary': '#2e7d32',
+    'secondary': '#1976d2',
+    'success': '#4caf50',
+    'warning': '#ff9800',
+    'error': '#f44336',
+    'dark': '#212121',
+    'light': '#fafafa'
+}
+
+DEFAULT_TEMPLATE = """Hi {recipient_name},
+
+Please find attached your {current_month} pricing update.
+
+The pricing reflects changes from {previous_month}.
+
+If you have any questions, please don't hesitate to contact us.
+
+Best regards,
+{sender_name}"""
+
 class CustomerManagementPanel:
     """Customer Management Panel with enhanced verification console"""
 
+    # Oldest console lines are dropped past this point so the Text
+    # widget stays bounded over long verification runs
+    MAX_CONSOLE_LINES = 2000
+
+    # Rows materialized in the tree per page; more attach as the user
+    # scrolls toward the bottom
+    PAGE = 200
+
+    # Fixed column widths; stretch is disabled so Tk skips its per-resize
+    # width redistribution pass
+    COL_WIDTHS = {'ID': 80, 'Company': 150, 'Domain': 80, 'Emails': 100, 'Status': 80}
+
     def __init__(self, parent_frame, dashboard_ref, database_file="data/customer_database.json"):
         self.parent_frame = parent_frame
         self.dashboard_ref = dashboard_ref
@@ -43,7 +94,59 @@ class CustomerManagementPanel:
         self.verification_console = None
         self.current_customer = None
 
+        # Shared add/edit dialog, built lazily and withdrawn between
+        # uses so each open skips widget construction
+        self._customer_dialog = None
+
+        # Console lines queued by the verification worker; drained on
+        # the UI thread by _flush_console in batched inserts
+        self._console_buffer = deque()
+        self._console_lines = 0
+
+        # Worker → UI marshalling: the verification worker posts
+        # ('progress'|'summary'|'refresh'|'done', ...) items here and
+        # _pump_ui applies them on the Tk thread every 50ms
+        self._ui_queue = queue.Queue()
+
+        # (iid, values, lowercase searchable text) per active customer;
+        # the filter and pagination both work off this list so the tree
+        # only ever holds the rows the user can reach
+        self._all_rows = []
+        self._visible_rows = []
+        self._rows_attached = 0
+        self._search_after_id = None
+
+        # Parsed customer list keyed on database file mtime, so refreshes
+        # reuse the parse until the file actually changes; the by-id dict
+        # (keyed by tree iid) makes edit/delete lookups O(1)
+        self._customer_cache = None
+        self._cache_mtime = None
+        self._customers_by_id = {}
+        # Per-id derived values (search blob, email count, file count),
+        # kept out of the records so they are never saved to disk
+        self._derived = {}
+
         self.setup_customer_management_ui()
+        self.parent_frame.after(50, self._pump_ui)
+
+    def _pump_ui(self):
+        """Apply queued worker updates on the UI thread, then reschedule"""
+        try:
+            while True:
+                item = self._ui_queue.get_nowait()
+                kind = item[0]
+                if kind == 'progress':
+                    self.progress_var.set(item[1])
+                elif kind == 'summary':
+                    self.summary_label.config(text=item[1])
+                elif kind == 'refresh':
+                    self.refresh_customer_list()
+                elif kind == 'done':
+                    self.verify_all_btn.config(state='normal')
+        except queue.Empty:
+            pass
+        self._flush_console()
+        self.parent_frame.after(50, self._pump_ui)
 
     def setup_customer_management_ui(self):
         """Setup the customer management interface with 50/50 split"""
@@ -87,22 +190,24 @@ class CustomerManagementPanel:
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
         # Treeview for customer list
-        columns = ('ID', 'Company', 'Domain', 'Emails', 'Status')
+        columns = tuple(self.COL_WIDTHS)
         self.customer_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=15)
 
         # Define headings
-        for col in columns:
+        for col, width in self.COL_WIDTHS.items():
             self.customer_tree.heading(col, text=col)
-            if col == 'Company':
-                self.customer_tree.column(col, width=150)
-            elif col == 'Emails':
-                self.customer_tree.column(col, width=100)
-            else:
-                self.customer_tree.column(col, width=80)
-
-        # Scrollbars
+            self.customer_tree.column(col, width=width, stretch=False)
+
+        # Scrollbars; the yscroll hook attaches the next page of rows
+        # once the user scrolls near the bottom
         vsb = ttk.Scrollbar(list_frame, orient="vertical", command=self.customer_tree.yview)
-        self.customer_tree.configure(yscrollcommand=vsb.set)
+
+        def on_tree_scroll(first, last):
+            vsb.set(first, last)
+            if float(last) > 0.9:
+                self._load_more_rows()
+
+        self.customer_tree.configure(yscrollcommand=on_tree_scroll)
 
         # Pack treeview and scrollbar
         self.customer_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -189,21 +294,87 @@ class CustomerManagementPanel:
         self.summary_label = ttk.Label(summary_frame, text="Ready to verify", font=('Segoe UI', 10))
         self.summary_label.pack(padx=10, pady=5)
 
+    def _get_customers_cached(self):
+        """Return all customers, reparsing the JSON only when it changes"""
+        try:
+            mtime = os.path.getmtime(self.database_file)
+        except OSError:
+            mtime = None
+        if self._customer_cache is None or mtime != self._cache_mtime:
+            self._customer_cache = self.database.get_all_customers()
+            self._cache_mtime = mtime
+            # Derived values live in a parallel dict keyed by id — never
+            # on the customer records themselves, which are the same
+            # objects the database serializes back to disk on edits.
+            # Per id: (lowercase search blob, email count, file count);
+            # normalizing the dict-vs-list file_generation shape here
+            # keeps the verification loop branchless
+            self._derived = {}
+            for customer in self._customer_cache:
+                blob = (
+                    f"{customer['company_name']} {customer['email_domain']} "
+                    f"{' '.join(customer['email_addresses'])}"
+                ).lower()
+                file_gen = customer.get('file_generation', {})
+                if isinstance(file_gen, dict):
+                    file_count = 1 if file_gen.get('file_path') else 0
+                else:
+                    file_count = len(file_gen)
+                self._derived[str(customer['id'])] = (
+                    blob, len(customer['email_addresses']), file_count)
+            self._customers_by_id = {
+                str(customer['id']): customer for customer in self._customer_cache}
+        return self._customer_cache
+
+    def _invalidate_customer_cache(self):
+        """Force the next read to reparse after add/edit/delete"""
+        self._customer_cache = None
+
     def add_console_message(self, message, tag='info'):
-        """Add a message to the verification console"""
+        """Queue a message for the verification console.
+
+        Only appends to the buffer, so the verification worker thread
+        never touches Tk at all; _pump_ui drains bursts in one batch.
+        """
+        # time.strftime skips the datetime object construction
+        timestamp = time.strftime("%H:%M:%S")
+        self._console_buffer.append((timestamp, message, tag))
+
+    def _flush_console(self):
+        """Drain queued console messages in batched inserts (UI thread)"""
+        if not self._console_buffer:
+            return
+
+        # Merge consecutive same-tag text into runs so each run is one
+        # insert instead of one insert per line
+        segments = []
+        while self._console_buffer:
+            timestamp, message, tag = self._console_buffer.popleft()
+            for text, seg_tag in ((f"[{timestamp}] ", 'info'), (f"{message}\n", tag)):
+                if segments and segments[-1][1] == seg_tag:
+                    segments[-1][0].append(text)
+                else:
+                    segments.append(([text], seg_tag))
+
         self.verification_console.configure(state=tk.NORMAL)
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.verification_console.insert(tk.END, f"[{timestamp}] ", 'info')
-        self.verification_console.insert(tk.END, f"{message}\n", tag)
+        for parts, seg_tag in segments:
+            text = ''.join(parts)
+            self.verification_console.insert(tk.END, text, seg_tag)
+            self._console_lines += text.count('\n')
+        # Drop the oldest lines once the scrollback exceeds the cap
+        excess = self._console_lines - self.MAX_CONSOLE_LINES
+        if excess > 0:
+            self.verification_console.delete('1.0', f'{excess + 1}.0')
+            self._console_lines = self.MAX_CONSOLE_LINES
         self.verification_console.configure(state=tk.DISABLED)
         self.verification_console.see(tk.END)
-        self.parent_frame.update_idletasks()
 
     def clear_verification_console(self):
         """Clear the verification console"""
         self.verification_console.configure(state=tk.NORMAL)
         self.verification_console.delete(1.0, tk.END)
         self.verification_console.configure(state=tk.DISABLED)
+        self._console_lines = 0
         self.progress_var.set(0)
         self.summary_label.config(text="Ready to verify")
 
@@ -218,10 +389,10 @@ class CustomerManagementPanel:
         def verification_thread():
             try:
                 self.add_console_message("STARTING VERIFICATION OF ALL CUSTOMERS", 'header')
-                self.add_console_message("=" * 60, 'info')
+                self.add_console_message(SEP_60, 'info')
 
                 # Get all customers
-                customers = self.database.get_all_customers()
+                customers = self._get_customers_cached()
                 total_customers = len(customers)
 
                 if total_customers == 0:
@@ -230,152 +401,232 @@ class CustomerManagementPanel:
 
                 self.add_console_message(f"Found {total_customers} customers to verify\n", 'info')
 
-                # Track results
-                results = {
-                    'passed': [],
-                    'failed': [],
-                    'warnings': []
-                }
-
-                # Verify each customer
-                for idx, customer in enumerate(customers):
-                    customer_id = customer['id']
-                    company_name = customer['company_name']
-
-                    # Update progress
-                    progress = ((idx + 1) / total_customers) * 100
-                    self.progress_var.set(progress)
-
-                    self.add_console_message(f"\n[{idx+1}/{total_customers}] Verifying: {company_name}", 'header')
-                    self.add_console_message("-" * 40, 'info')
-
-                    # Perform verification
-                    verification_result = self.verification_system.verify_customer(customer_id)
-
-                    if verification_result['overall_status'] == 'passed':
-                        self.add_console_message(f"✓ Domain verified: {customer['email_domain']}", 'success')
-                        self.add_console_message(f"✓ Recipients verified: {len(customer['email_addresses'])} emails", 'success')
-                        # Handle file_generation as either dict or list
-                        file_gen = customer.get('file_generation', {})
-                        if isinstance(file_gen, dict):
-                            file_count = 1 if file_gen.get('file_path') else 0
+                # Track results; bound append methods keep the hot loop
+                # on fast local lookups
+                passed, warned, failed = [], [], []
+                passed_append = passed.append
+                warned_append = warned.append
+                failed_append = failed.append
+
+                # Each verify_customer call writes its status back to the
+                # database; batch them so the JSON file is dumped once at
+                # the end of the run instead of once per customer
+                try:
+                    batch = self.verification_system.database.batch()
+                except AttributeError:
+                    batch = nullcontext()
+
+                # Verification is dominated by domain/file-path I/O, so
+                # fan the checks out across a thread pool and report each
+                # customer as its result completes
+                with batch:
+                    executor = ThreadPoolExecutor(max_workers=16)
+                    future_map = {
+                        executor.submit(self.verification_system.verify_customer, customer['id']): customer
+                        for customer in customers
+                    }
+
+                    for done, future in enumerate(as_completed(future_map), 1):
+                        customer = future_map[future]
+                        company_name = customer['company_name']
+
+                        # Update progress
+                        progress = (done / total_customers) * 100
+                        self._ui_queue.put(('progress', progress))
+
+                        self.add_console_message(f"\n[{done}/{total_customers}] Verified: {company_name}", 'header')
+                        self.add_console_message(SEP_40, 'info')
+
+                        verification_result = future.result()
+
+                        if verification_result['overall_status'] == 'passed':
+                            _blob, n_emails, file_count = self._derived[str(customer['id'])]
+                            self.add_console_message(f"✓ Domain verified: {customer['email_domain']}", 'success')
+                            self.add_console_message(f"✓ Recipients verified: {n_emails} emails", 'success')
+                            self.add_console_message(f"✓ File paths verified: {file_count} file{'s' if file_count != 1 else ''}", 'success')
+                            self.add_console_message("STATUS: PASSED", 'success')
+                            passed_append(company_name)
+                        elif verification_result['overall_status'] == 'warning':
+                            for issue in verification_result['issues']:
+                                self.add_console_message(f"⚠ {issue['message']}", 'warning')
+                            self.add_console_message("STATUS: WARNING", 'warning')
+                            warned_append(company_name)
                         else:
-                            file_count = len(file_gen)
-                        self.add_console_message(f"✓ File paths verified: {file_count} file{'s' if file_count != 1 else ''}", 'success')
-                        self.add_console_message("STATUS: PASSED", 'success')
-                        results['passed'].append(company_name)
-                    elif verification_result['overall_status'] == 'warning':
-                        for issue in verification_result['issues']:
-                            self.add_console_message(f"⚠ {issue['message']}", 'warning')
-                        self.add_console_message("STATUS: WARNING", 'warning')
-                        results['warnings'].append(company_name)
-                    else:
-                        for issue in verification_result['issues']:
-                            self.add_console_message(f"✗ {issue['message']}", 'error')
-                        self.add_console_message("STATUS: FAILED", 'error')
-                        results['failed'].append(company_name)
-
-                # Display summary
-                self.add_console_message("\n" + "=" * 60, 'info')
-                self.add_console_message("VERIFICATION COMPLETE - SUMMARY", 'header')
-                self.add_console_message("=" * 60, 'info')
-
-                self.add_console_message(f"\nTotal Customers: {total_customers}", 'info')
-                self.add_console_message(f"✓ Passed: {len(results['passed'])} ({len(results['passed'])*100//total_customers}%)", 'success')
-                self.add_console_message(f"⚠ Warnings: {len(results['warnings'])} ({len(results['warnings'])*100//total_customers}%)", 'warning')
-                self.add_console_message(f"✗ Failed: {len(results['failed'])} ({len(results['failed'])*100//total_customers}%)", 'error')
+                            for issue in verification_result['issues']:
+                                self.add_console_message(f"✗ {issue['message']}", 'error')
+                            self.add_console_message("STATUS: FAILED", 'error')
+                            failed_append(company_name)
+
+                    executor.shutdown()
+
+                # Display summary as a single multi-line message so the
+                # console flush does one insert for the whole block
+                n_passed, n_warned, n_failed = len(passed), len(warned), len(failed)
+                self.add_console_message(
+                    f"\n{SEP_60}\n"
+                    "VERIFICATION COMPLETE - SUMMARY\n"
+                    f"{SEP_60}\n\n"
+                    f"Total Customers: {total_customers}\n"
+                    f"✓ Passed: {n_passed} ({n_passed*100//total_customers}%)\n"
+                    f"⚠ Warnings: {n_warned} ({n_warned*100//total_customers}%)\n"
+                    f"✗ Failed: {n_failed} ({n_failed*100//total_customers}%)",
+                    'header')
 
                 # List failed customers if any
-                if results['failed']:
-                    self.add_console_message("\nFailed Customers:", 'error')
-                    for customer in results['failed']:
-                        self.add_console_message(f"  - {customer}", 'error')
+                if failed:
+                    self.add_console_message(
+                        "\nFailed Customers:\n" + '\n'.join(f"  - {name}" for name in failed),
+                        'error')
 
                 # Update summary label
-                summary_text = f"Passed: {len(results['passed'])} | Warnings: {len(results['warnings'])} | Failed: {len(results['failed'])}"
-                self.summary_label.config(text=summary_text)
+                summary_text = f"Passed: {n_passed} | Warnings: {n_warned} | Failed: {n_failed}"
+                self._ui_queue.put(('summary', summary_text))
 
                 # Update customer list to reflect verification status
-                self.refresh_customer_list()
+                self._ui_queue.put(('refresh',))
 
             except Exception as e:
                 self.add_console_message(f"\nERROR: {str(e)}", 'error')
             finally:
                 # Re-enable verify button
-                self.verify_all_btn.config(state='normal')
-                self.progress_var.set(100)
+                self._ui_queue.put(('progress', 100))
+                self._ui_queue.put(('done',))
 
         # Run verification in separate thread
         thread = threading.Thread(target=verification_thread, daemon=True)
         thread.start()
 
     def refresh_customer_list(self):
-        """Refresh the customer list display"""
-        # Clear current items
-        for item in self.customer_tree.get_children():
-            self.customer_tree.delete(item)
-
-        # Get search term
-        search_term = self.search_var.get().lower()
-
-        # Load and display customers
-        customers = self.database.get_all_customers()
+        """Rebuild the row list from the database and show the first page"""
+        customers = self._get_customers_cached()
 
+        self._all_rows = []
         for customer in customers:
             # Skip inactive customers
             if not customer.get('active', True):
                 continue
 
-            # Check if search term matches any field
-            searchable_text = f"{customer['company_name']} {customer['email_domain']} {' '.join(customer['email_addresses'])}".lower()
+            customer_id = customer['id']
+            company = customer['company_name']
+            domain = customer['email_domain']
+            blob, email_count, _file_count = self._derived[str(customer_id)]
+            status = "✓" if customer['verification_status']['domain_verified'] else "⚠"
 
-            if not search_term or search_term in searchable_text:
-                customer_id = customer['id']
-                company = customer['company_name']
-                domain = customer['email_domain']
-                email_count = len(customer['email_addresses'])
-                status = "✓" if customer['verification_status']['domain_verified'] else "⚠"
+            self._all_rows.append((
+                str(customer_id),
+                (customer_id, company, domain, f"{email_count}", status),
+                blob,
+            ))
 
-                self.customer_tree.insert('', tk.END, values=(
-                    customer_id, company, domain, f"{email_count}", status
-                ))
+        self._apply_search_filter()
 
     def search_customers(self):
-        """Search customers based on search term"""
-        self.refresh_customer_list()
+        """Filter customers after a short debounce so bursty typing
+        triggers one pass instead of one per keystroke"""
+        if self._search_after_id is not None:
+            self.parent_frame.after_cancel(self._search_after_id)
+        self._search_after_id = self.parent_frame.after(150, self._apply_search_filter)
+
+    def _apply_search_filter(self):
+        """Repopulate the tree with the first page of matching rows"""
+        self._search_after_id = None
+        search_term = self.search_var.get().lower()
+
+        if search_term:
+            self._visible_rows = [row for row in self._all_rows
+                                  if search_term in row[2]]
+        else:
+            self._visible_rows = self._all_rows
+
+        for item in self.customer_tree.get_children():
+            self.customer_tree.delete(item)
+        self._rows_attached = 0
+        self._load_more_rows()
+
+    def _load_more_rows(self):
+        """Attach the next page of filtered rows to the tree"""
+        end = min(self._rows_attached + self.PAGE, len(self._visible_rows))
+        for iid, values, _blob in self._visible_rows[self._rows_attached:end]:
+            self.customer_tree.insert('', tk.END, iid=iid, values=values)
+        self._rows_attached = end
+
+    def _get_customer_dialog(self):
+        """Return the shared add/edit dialog, building it on first use.
+
+        Widget construction is Tk's slow path, so the dialog is created
+        once and withdrawn between uses instead of destroyed.
+        """
+        if self._customer_dialog is not None:
+            return self._customer_dialog
 
-    def add_customer_dialog(self):
-        """Show dialog to add new customer"""
         dialog = tk.Toplevel(self.parent_frame)
-        dialog.title("Add New Customer")
         dialog.geometry("500x400")
+        dialog.withdraw()
+        dialog.protocol('WM_DELETE_WINDOW', dialog.withdraw)
 
         # Form fields
         form_frame = ttk.Frame(dialog)
         form_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         ttk.Label(form_frame, text="Company Name:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        company_entry = ttk.Entry(form_frame, width=40)
-        company_entry.grid(row=0, column=1, pady=5)
+        self._dlg_company = ttk.Entry(form_frame, width=40)
+        self._dlg_company.grid(row=0, column=1, pady=5)
 
         ttk.Label(form_frame, text="Email Domain:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        domain_entry = ttk.Entry(form_frame, width=40)
-        domain_entry.grid(row=1, column=1, pady=5)
+        self._dlg_domain = ttk.Entry(form_frame, width=40)
+        self._dlg_domain.grid(row=1, column=1, pady=5)
 
         ttk.Label(form_frame, text="Email Addresses:").grid(row=2, column=0, sticky=tk.NW, pady=5)
-        email_text = tk.Text(form_frame, width=40, height=5)
-        email_text.grid(row=2, column=1, pady=5)
+        self._dlg_emails = tk.Text(form_frame, width=40, height=5)
+        self._dlg_emails.grid(row=2, column=1, pady=5)
         ttk.Label(form_frame, text="(One per line)", font=('Segoe UI', 8)).grid(row=3, column=1, sticky=tk.W)
 
         ttk.Label(form_frame, text="Recipient Names:").grid(row=4, column=0, sticky=tk.NW, pady=5)
-        names_text = tk.Text(form_frame, width=40, height=5)
-        names_text.grid(row=4, column=1, pady=5)
+        self._dlg_names = tk.Text(form_frame, width=40, height=5)
+        self._dlg_names.grid(row=4, column=1, pady=5)
+
+        # Buttons; the Save command is rebound per open
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(fill=tk.X, pady=10)
+
+        self._dlg_save_btn = ttk.Button(button_frame, text="Save")
+        self._dlg_save_btn.pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.RIGHT, padx=5)
+
+        self._customer_dialog = dialog
+        return dialog
+
+    def _show_customer_dialog(self, title, save_text, save_command,
+                              company='', domain='', emails='', names=''):
+        """Reconfigure the shared dialog for add or edit and show it"""
+        dialog = self._get_customer_dialog()
+        dialog.title(title)
+        self._dlg_company.delete(0, tk.END)
+        self._dlg_company.insert(0, company)
+        self._dlg_domain.delete(0, tk.END)
+        self._dlg_domain.insert(0, domain)
+        self._dlg_emails.delete(1.0, tk.END)
+        self._dlg_emails.insert(1.0, emails)
+        self._dlg_names.delete(1.0, tk.END)
+        self._dlg_names.insert(1.0, names)
+        self._dlg_save_btn.config(text=save_text, command=save_command)
+        dialog.deiconify()
+        dialog.lift()
+
+    def _read_dialog_fields(self):
+        """Read the shared dialog's form fields, normalized"""
+        company = self._dlg_company.get().strip()
+        domain = self._dlg_domain.get().strip()
+        # splitlines on 'end-1c' avoids the extra strip/split passes and
+        # strips each line only once, which matters for large paste-ins
+        emails = [e for e in (line.strip() for line in self._dlg_emails.get('1.0', 'end-1c').splitlines()) if e]
+        names = [n for n in (line.strip() for line in self._dlg_names.get('1.0', 'end-1c').splitlines()) if n]
+        return company, domain, emails, names
 
+    def add_customer_dialog(self):
+        """Show dialog to add new customer"""
         def save_customer():
-            company = company_entry.get().strip()
-            domain = domain_entry.get().strip()
-            emails = [e.strip() for e in email_text.get(1.0, tk.END).strip().split('\n') if e.strip()]
-            names = [n.strip() for n in names_text.get(1.0, tk.END).strip().split('\n') if n.strip()]
+            company, domain, emails, names = self._read_dialog_fields()
 
             if not company or not domain or not emails:
                 messagebox.showerror("Error", "Please fill in all required fields")
@@ -390,18 +641,14 @@ class CustomerManagementPanel:
                     'file_generation': [],
                     'active': True
                 })
+                self._invalidate_customer_cache()
                 self.refresh_customer_list()
-                dialog.destroy()
+                self._customer_dialog.withdraw()
                 messagebox.showinfo("Success", "Customer added successfully")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to add customer: {str(e)}")
 
-        # Buttons
-        button_frame = ttk.Frame(dialog)
-        button_frame.pack(fill=tk.X, pady=10)
-
-        ttk.Button(button_frame, text="Save", command=save_customer).pack(side=tk.RIGHT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        self._show_customer_dialog("Add New Customer", "Save", save_customer)
 
     def edit_customer(self, event=None):
         """Edit selected customer"""
@@ -410,62 +657,37 @@ class CustomerManagementPanel:
             messagebox.showwarning("Warning", "Please select a customer to edit")
             return
 
-        customer_id = self.customer_tree.item(selection[0])['values'][0]
-        customer = self.database.get_customer_by_id(customer_id)
+        # The tree iid is the customer id, so this is a dict hit rather
+        # than a scan of the database
+        customer = self._customers_by_id.get(selection[0])
 
         if not customer:
             messagebox.showerror("Error", "Customer not found")
             return
-
-        # Create edit dialog (similar to add_customer_dialog but pre-populated)
-        dialog = tk.Toplevel(self.parent_frame)
-        dialog.title(f"Edit Customer: {customer['company_name']}")
-        dialog.geometry("500x400")
-
-        # Form fields
-        form_frame = ttk.Frame(dialog)
-        form_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        ttk.Label(form_frame, text="Company Name:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        company_entry = ttk.Entry(form_frame, width=40)
-        company_entry.insert(0, customer['company_name'])
-        company_entry.grid(row=0, column=1, pady=5)
-
-        ttk.Label(form_frame, text="Email Domain:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        domain_entry = ttk.Entry(form_frame, width=40)
-        domain_entry.insert(0, customer['email_domain'])
-        domain_entry.grid(row=1, column=1, pady=5)
-
-        ttk.Label(form_frame, text="Email Addresses:").grid(row=2, column=0, sticky=tk.NW, pady=5)
-        email_text = tk.Text(form_frame, width=40, height=5)
-        email_text.insert(1.0, '\n'.join(customer['email_addresses']))
-        email_text.grid(row=2, column=1, pady=5)
-
-        ttk.Label(form_frame, text="Recipient Names:").grid(row=4, column=0, sticky=tk.NW, pady=5)
-        names_text = tk.Text(form_frame, width=40, height=5)
-        names_text.insert(1.0, '\n'.join(customer.get('recipient_names', [])))
-        names_text.grid(row=4, column=1, pady=5)
+        customer_id = customer['id']
 
         def save_changes():
-            customer['company_name'] = company_entry.get().strip()
-            customer['email_domain'] = domain_entry.get().strip()
-            customer['email_addresses'] = [e.strip() for e in email_text.get(1.0, tk.END).strip().split('\n') if e.strip()]
-            customer['recipient_names'] = [n.strip() for n in names_text.get(1.0, tk.END).strip().split('\n') if n.strip()]
+            company, domain, emails, names = self._read_dialog_fields()
+            customer['company_name'] = company
+            customer['email_domain'] = domain
+            customer['email_addresses'] = emails
+            customer['recipient_names'] = names
 
             try:
                 self.database.update_customer(customer_id, customer)
+                self._invalidate_customer_cache()
                 self.refresh_customer_list()
-                dialog.destroy()
+                self._customer_dialog.withdraw()
                 messagebox.showinfo("Success", "Customer updated successfully")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to update customer: {str(e)}")
 
-        # Buttons
-        button_frame = ttk.Frame(dialog)
-        button_frame.pack(fill=tk.X, pady=10)
-
-        ttk.Button(button_frame, text="Save Changes", command=save_changes).pack(side=tk.RIGHT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        self._show_customer_dialog(
+            f"Edit Customer: {customer['company_name']}", "Save Changes", save_changes,
+            company=customer['company_name'],
+            domain=customer['email_domain'],
+            emails='\n'.join(customer['email_addresses']),
+            names='\n'.join(customer.get('recipient_names', [])))
 
     def delete_customer(self):
         """Delete selected customer"""
@@ -474,12 +696,17 @@ class CustomerManagementPanel:
             messagebox.showwarning("Warning", "Please select a customer to delete")
             return
 
-        customer_id = self.customer_tree.item(selection[0])['values'][0]
-        company_name = self.customer_tree.item(selection[0])['values'][1]
+        customer = self._customers_by_id.get(selection[0])
+        if not customer:
+            messagebox.showerror("Error", "Customer not found")
+            return
+        customer_id = customer['id']
+        company_name = customer['company_name']
 
         if messagebox.askyesno("Confirm Delete", f"Delete customer '{company_name}'?"):
             try:
                 self.database.delete_customer(customer_id)
+                self._invalidate_customer_cache()
                 self.refresh_customer_list()
                 messagebox.showinfo("Success", "Customer deleted successfully")
             except Exception as e:
@@ -505,29 +732,34 @@ class EmailDraftDashboard:
         self.style.theme_use('clam')
 
         # Color scheme
-        self.colors = {
-            'primary': '#2e7d32',
-            'secondary': '#1976d2',
-            'success': '#4caf50',
-            'warning': '#ff9800',
-            'error': '#f44336',
-            'dark': '#212121',
-            'light': '#fafafa'
-        }
+        self.colors = COLORS
 
         # Configure styles
         self.configure_styles()
 
-        # User signature settings
+        # User signature settings; signature HTML is read lazily on
+        # first use so startup doesn't block on the files
         self.selected_user = tk.StringVar(value="Mark Anderson")
-        self.signatures = self.load_signatures()
+        self._signature_cache = {}
+
+        # Rendered per-user preview suffix; built lazily and refreshed
+        # when the user selection changes
+        self._sig_suffix = None
 
         # Default email template
-        self.default_template = self.load_default_template()
+        self.default_template = DEFAULT_TEMPLATE
 
         # Debug mode
         self.debug_enabled = tk.BooleanVar(value=False)
 
+        # Pending debounced preview render, if any
+        self._preview_after_id = None
+
+        # Buffered debug lines plus the pending flush callback id;
+        # _flush_debug drains the buffer in a single insert
+        self._debug_buf = []
+        self._debug_flush_id = None
+
         # Setup UI
         self.setup_ui()
 
@@ -549,37 +781,34 @@ class EmailDraftDashboard:
         self.style.configure('Header.TLabel',
                            font=('Segoe UI', 14, 'bold'))
 
-    def load_signatures(self):
-        """Load HTML signatures from data folder"""
-        signatures = {}
-        sig_files = {
-            'Mark Anderson': 'data/Mark_Anderson_231123.html',
-            'Jason Najm': 'data/Jason_Najm_250427.html'
-        }
+    SIG_FILES = {
+        'Mark Anderson': 'data/Mark_Anderson_231123.html',
+        'Jason Najm': 'data/Jason_Najm_250427.html'
+    }
 
-        for name, path in sig_files.items():
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    signatures[name] = f.read()
-            except FileNotFoundError:
-                signatures[name] = f"<p>Best regards,<br>{name}<br>Valorem Chemicals</p>"
+    def _load_signature(self, name):
+        """Load a user's HTML signature on first use, cached on mtime.
 
-        return signatures
+        A single read_bytes + decode keeps the read at the C level, and
+        keying on mtime means an edited signature file is picked up
+        without restarting the dashboard.
+        """
+        path = self.SIG_FILES.get(name)
+        try:
+            mtime = os.path.getmtime(path)
+        except (OSError, TypeError):
+            return f"<p>Best regards,<br>{name}<br>Valorem Chemicals</p>"
+
+        key = (path, mtime)
+        cached = self._signature_cache.get(key)
+        if cached is None:
+            cached = Path(path).read_bytes().decode('utf-8')
+            self._signature_cache[key] = cached
+        return cached
 
     def load_default_template(self):
         """Load default email template"""
-        template = """Hi {recipient_name},
-
-Please find attached your {current_month} pricing update.
-
-The pricing reflects changes from {previous_month}.
-
-If you have any questions, please don't hesitate to contact us.
-
-Best regards,
-{sender_name}"""
-
-        return template
+        return DEFAULT_TEMPLATE
 
     def setup_ui(self):
         """Setup the main user interface"""
@@ -599,9 +828,7 @@ Best regards,
 
         # Logo on the left
         try:
-            # Load and resize logo
-            logo_img = Image.open('valorem_logo.png')
-            logo_img = logo_img.resize((150, 50), Image.Resampling.LANCZOS)
+            logo_img = self._load_logo('valorem_logo.png')
             self.logo_photo = ImageTk.PhotoImage(logo_img)
 
             logo_label = tk.Label(header_frame, image=self.logo_photo, bg='white')
@@ -631,6 +858,28 @@ Best regards,
                                       command=self.toggle_debug_panel)
         debug_check.pack(side=tk.LEFT, padx=(10, 0))
 
+    def _load_logo(self, source_path, size=(150, 50)):
+        """Load the header logo, preferring a pre-resized cached copy.
+
+        The LANCZOS downscale of the full-size PNG runs once; later
+        launches read the small cached file and skip the resample.
+        """
+        root, ext = os.path.splitext(source_path)
+        cached_path = f"{root}_{size[0]}x{size[1]}{ext}"
+
+        try:
+            if os.path.getmtime(cached_path) >= os.path.getmtime(source_path):
+                return Image.open(cached_path)
+        except OSError:
+            pass
+
+        logo_img = Image.open(source_path).resize(size, Image.Resampling.LANCZOS)
+        try:
+            logo_img.save(cached_path)
+        except OSError:
+            pass
+        return logo_img
+
     def setup_main_content(self):
         """Setup main content area"""
         # Main notebook for tabs
@@ -699,8 +948,10 @@ Best regards,
         # Insert default template
         self.template_editor.insert(1.0, self.default_template)
 
-        # Bind change event for auto-save
-        self.template_editor.bind('<<Modified>>', self.on_template_changed)
+        # Bind change event for auto-save; debounced so a burst of
+        # keystrokes collapses into one save
+        self._template_save_id = None
+        self.template_editor.bind('<<Modified>>', self._schedule_template_save)
 
         # Variable help
         help_frame = ttk.Frame(parent)
@@ -721,9 +972,7 @@ Best regards,
         ttk.Label(date_frame, text="Month:").grid(row=0, column=0, padx=5, pady=5)
         self.month_var = tk.StringVar(value=today.strftime('%B'))
         month_dropdown = ttk.Combobox(date_frame, textvariable=self.month_var,
-                                      values=['January', 'February', 'March', 'April',
-                                             'May', 'June', 'July', 'August',
-                                             'September', 'October', 'November', 'December'],
+                                      values=MONTHS,
                                       state='readonly', width=12)
         month_dropdown.grid(row=0, column=1, padx=5, pady=5)
 
@@ -813,12 +1062,37 @@ Best regards,
     def on_user_changed(self, event=None):
         """Handle user selection change"""
         self.update_status(f"Switched to user: {self.selected_user.get()}")
+        self._refresh_sig_suffix()
+        self._schedule_preview()
+
+    def _refresh_sig_suffix(self):
+        """Pre-render the preview signature suffix for the current user"""
+        signature = self._load_signature(self.selected_user.get())
+        # HTML signatures are not shown in the plain-text preview
+        self._sig_suffix = f"\n\n{signature}" if signature and not signature.startswith("<") else ""
+
+    def _schedule_preview(self):
+        """Debounce preview renders so bursts of changes draw once"""
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(150, self._run_preview)
+
+    def _run_preview(self):
+        self._preview_after_id = None
         self.preview_template()
 
+    def _schedule_template_save(self, event=None):
+        """Debounce <<Modified>> events into a single deferred auto-save"""
+        # Re-arm the event and reschedule so only the last keystroke in a
+        # burst triggers on_template_changed
+        self.template_editor.edit_modified(False)
+        if self._template_save_id is not None:
+            self.root.after_cancel(self._template_save_id)
+        self._template_save_id = self.root.after(300, self.on_template_changed)
+
     def on_template_changed(self, event=None):
         """Handle template change (auto-save)"""
-        # Mark as modified
-        self.template_editor.edit_modified(False)
+        self._template_save_id = None
         # Auto-save template
         self.default_template = self.template_editor.get(1.0, tk.END).strip()
 
@@ -831,11 +1105,27 @@ Best regards,
             self.debug_frame.pack_forget()
 
     def add_debug_message(self, message):
-        """Add message to debug console"""
+        """Add message to debug console (buffered, flushed in batches)"""
         if self.debug_enabled.get():
             timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            self.debug_text.insert(tk.END, f"[{timestamp}] {message}\n")
-            self.debug_text.see(tk.END)
+            self._debug_buf.append(f"[{timestamp}] {message}\n")
+            # One flush per burst; each insert triggers a Text reflow, so
+            # generation runs would otherwise repaint per message
+            if self._debug_flush_id is None:
+                self._debug_flush_id = self.root.after(100, self._flush_debug)
+
+    def _flush_debug(self):
+        """Insert all buffered debug lines in one batch (UI thread)"""
+        self._debug_flush_id = None
+        if not self._debug_buf:
+            return
+        self.debug_text.insert(tk.END, ''.join(self._debug_buf))
+        self._debug_buf.clear()
+        # Keep only the most recent lines so the widget stays bounded
+        total_lines = int(self.debug_text.index('end-1c').split('.')[0])
+        if total_lines > 5000:
+            self.debug_text.delete('1.0', f'{total_lines - 5000 + 1}.0')
+        self.debug_text.see(tk.END)
 
     def preview_template(self):
         """Preview the email template with sample data"""
@@ -849,20 +1139,17 @@ Best regards,
             'sender_name': self.selected_user.get()
         }
 
-        # Format template
+        # Format template; the signature suffix is pre-rendered per user
         try:
-            preview_text = template.format(**sample_data)
-
-            # Add signature
-            signature = self.signatures.get(self.selected_user.get(), "")
-            if signature and not signature.startswith("<"):
-                preview_text += f"\n\n{signature}"
+            if self._sig_suffix is None:
+                self._refresh_sig_suffix()
+            preview_text = template.format(**sample_data) + self._sig_suffix
 
-            # Update preview
-            self.preview_text.config(state=tk.NORMAL)
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(1.0, preview_text)
-            self.preview_text.config(state=tk.DISABLED)
+            # Update preview, skipping the rewrite when nothing changed
+            if self.preview_text.get('1.0', 'end-1c') != preview_text:
+                self.preview_text.config(state=tk.NORMAL)
+                self.preview_text.replace('1.0', tk.END, preview_text)
+                self.preview_text.config(state=tk.DISABLED)
 
             self.update_status("Preview updated")
         except KeyError as e:
@@ -870,23 +1157,20 @@ Best regards,
 
     def get_previous_month(self):
         """Get the previous month name"""
-        months = ['January', 'February', 'March', 'April', 'May', 'June',
-                 'July', 'August', 'September', 'October', 'November', 'December']
-
-        current_idx = months.index(self.month_var.get())
-        prev_idx = (current_idx - 1) % 12
-        return months[prev_idx]
+        return MONTHS[(MONTH_IDX[self.month_var.get()] - 1) % 12]
 
     def generate_all_drafts(self):
         """Generate email drafts for all customers"""
         self.update_status("Generating drafts...")
         self.add_debug_message("Starting draft generation")
 
-        # Get template
+        # Read template, signature and Tk variables on the main thread;
+        # the worker must not touch widgets directly
         template = self.template_editor.get(1.0, tk.END).strip()
-
-        # Get signature for selected user
-        signature_html = self.signatures.get(self.selected_user.get(), "")
+        sender_name = self.selected_user.get()
+        signature_html = self._load_signature(sender_name)
+        month = self.month_var.get()
+        year = self.year_var.get()
 
         # Start generation in thread
         def generation_thread():
@@ -901,57 +1185,67 @@ Best regards,
                 active_customers = [c for c in customers if c.get('active', True)]
 
                 total = len(active_customers)
-                self.progress['maximum'] = total
+                self.root.after(0, lambda: self.progress.configure(maximum=total))
 
                 generated = 0
                 failed = []
 
-                for idx, customer in enumerate(active_customers):
-                    self.progress['value'] = idx + 1
-                    self.update_status(f"Processing {customer['company_name']}...")
-
-                    try:
-                        # Generate draft for customer
-                        result = email_generator.generate_single_draft(
-                            customer,
-                            template,
-                            signature_html,
-                            self.selected_user.get(),
-                            self.month_var.get(),
-                            self.year_var.get(),
-                            cc_emails_str
-                        )
+                # Draft creation is dominated by Outlook COM and disk I/O,
+                # so fan the customers out across a thread pool and handle
+                # each result as it completes; UI updates are marshalled
+                # back to the Tk thread via root.after
+                with ThreadPoolExecutor(max_workers=min(16, max(1, total))) as executor:
+                    futures = {
+                        executor.submit(
+                            email_generator.generate_single_draft,
+                            customer, template, signature_html,
+                            sender_name, month, year, cc_emails_str
+                        ): customer
+                        for customer in active_customers
+                    }
+
+                    for done, future in enumerate(as_completed(futures), 1):
+                        company = futures[future]['company_name']
+                        self.root.after(0, lambda d=done: self.progress.configure(value=d))
+                        self.root.after(0, self.update_status, f"Processed {company}...")
+
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            failed.append(company)
+                            self.root.after(0, self.add_debug_message, f"✗ Error for {company}: {str(e)}")
+                            continue
 
                         if result['success']:
                             generated += 1
-                            self.add_debug_message(f"✓ Generated draft for {customer['company_name']}")
+                            self.root.after(0, self.add_debug_message, f"✓ Generated draft for {company}")
                         else:
-                            failed.append(customer['company_name'])
-                            self.add_debug_message(f"✗ Failed: {customer['company_name']} - {result.get('error')}")
-
-                    except Exception as e:
-                        failed.append(customer['company_name'])
-                        self.add_debug_message(f"✗ Error for {customer['company_name']}: {str(e)}")
+                            failed.append(company)
+                            self.root.after(0, self.add_debug_message, f"✗ Failed: {company} - {result.get('error')}")
 
                 # Final status
-                self.progress['value'] = 0
                 status_msg = f"Generated {generated} drafts"
                 if failed:
                     status_msg += f", {len(failed)} failed"
 
-                self.update_status(status_msg)
+                def show_results():
+                    self.progress['value'] = 0
+                    self.update_status(status_msg)
+                    if failed:
+                        messagebox.showwarning("Generation Complete",
+                                             f"Generated {generated} drafts.\n\n"
+                                             f"Failed for:\n" + "\n".join(failed[:5]))
+                    else:
+                        messagebox.showinfo("Success", f"Successfully generated {generated} email drafts!")
 
-                # Show summary
-                if failed:
-                    messagebox.showwarning("Generation Complete",
-                                         f"Generated {generated} drafts.\n\n"
-                                         f"Failed for:\n" + "\n".join(failed[:5]))
-                else:
-                    messagebox.showinfo("Success", f"Successfully generated {generated} email drafts!")
+                self.root.after(0, show_results)
 
             except Exception as e:
-                self.update_status(f"Error: {str(e)}", 'error')
-                messagebox.showerror("Error", f"Generation failed: {str(e)}")
+                def show_error(msg=str(e)):
+                    self.update_status(f"Error: {msg}", 'error')
+                    messagebox.showerror("Error", f"Generation failed: {msg}")
+
+                self.root.after(0, show_error)
 
         # Start thread
         thread = threading.Thread(target=generation_thread, daemon=True)
@@ -3,6 +3,7 @@ Email generation module for creating Outlook drafts without terminal I/O.
 All functions return data instead of printing to console.
 """
 
+import calendar
 import win32com.client
 import pythoncom
 import pandas as pd
@@ -12,6 +13,7 @@ import logging
 import traceback
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
+from functools import lru_cache
 
 # Set up logging
 log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
@@ -237,23 +239,35 @@ def get_date_placeholders(selected_month=None, selected_year=None):
         # Use current date (backward compatibility)
         base_date = date.today()
 
-    current_month = base_date.strftime("%B")
-    current_year = base_date.year
-    previous_month = (base_date.replace(day=1) - relativedelta(months=1)).strftime("%B")
-    first_of_next_month = (base_date.replace(day=1) + relativedelta(months=1)).strftime("%B 1, %Y")
+    return dict(_date_placeholders_for(base_date.month, base_date.year))
+
+
+@lru_cache(maxsize=64)
+def _date_placeholders_for(month, year):
+    """Compute the placeholder values for one (month, year).
+
+    Month names come from calendar.month_name, which skips strftime's
+    locale machinery, and the result is memoized since a batch of drafts
+    asks for the same month repeatedly.
+    """
+    base_date = date(year, month, 1)
+    current_month = calendar.month_name[month]
+    previous = base_date - relativedelta(months=1)
+    following = base_date + relativedelta(months=1)
+    first_of_next_month = f"{calendar.month_name[following.month]} 1, {following.year}"
 
     # Calculate end of quarter based on selected date
-    quarter = (base_date.month - 1) // 3 + 1
+    quarter = (month - 1) // 3 + 1
     end_of_quarter_month = quarter * 3
-    end_of_quarter = date(base_date.year, end_of_quarter_month, 1) + relativedelta(months=1, days=-1)
+    end_of_quarter = date(year, end_of_quarter_month, 1) + relativedelta(months=1, days=-1)
 
     return {
         "current_month": current_month,
-        "current_year": current_year,
-        "previous_month": previous_month,
+        "current_year": year,
+        "previous_month": calendar.month_name[previous.month],
         "first_of_next_month": first_of_next_month,
         "effective_date": first_of_next_month,  # Alias for first_of_next_month
-        "end_of_quarter": end_of_quarter.strftime("%B %d, %Y"),
+        "end_of_quarter": f"{calendar.month_name[end_of_quarter.month]} {end_of_quarter.day:02d}, {end_of_quarter.year}",
         "month": current_month
     }
 
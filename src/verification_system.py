@@ -16,6 +16,7 @@ Date: 2025-09-16
 import json
 import os
 import re
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional
 import logging
@@ -61,8 +62,26 @@ class CustomerDatabase:
     def __init__(self, database_file: str = "data/customer_database.json"):
         self.database_file = database_file
         self.data = None
+        self._batch_depth = 0
+        self._batch_dirty = False
         self.load_database()
 
+    @contextmanager
+    def batch(self):
+        """Defer saves inside the block to a single write on exit.
+
+        Bulk operations such as verifying every customer otherwise
+        rewrite the whole JSON file once per record.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self.save_database()
+
     def load_database(self) -> None:
         """Load customer database from JSON file"""
         try:
@@ -148,6 +167,9 @@ class CustomerDatabase:
 
     def save_database(self) -> None:
         """Save the database back to JSON file"""
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
         try:
             with open(self.database_file, 'w', encoding='utf-8') as f:
                 json.dump(self.data, f, indent=2, ensure_ascii=False)